@@ -2,14 +2,14 @@ import pygame
 import random
 import time  # To introduce the delay before quitting
 
-# Initialize pygame
-pygame.init()
+from scenes import Scene
+from text_cache import text_cache
+from event_wait import wait_for_event
 
 # Set up the screen
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 400
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Serious difficult choice")
+CAPTION = "Serious difficult choice"
 
 # Colors
 WHITE = (210, 210, 210)
@@ -19,9 +19,9 @@ GREEN = (0, 220, 0)
 LIGHT_GREEN = (100, 255, 100)
 LIGHT_RED = (255, 100, 100)
 
-# Fonts
-main_font = pygame.font.SysFont('Arial', 40)
-question_font = pygame.font.SysFont('Arial', 30)
+# Fonts as (system font name, size)
+MAIN_FONT = ('Arial', 40)
+QUESTION_FONT = ('Arial', 30)
 
 
 class Button:
@@ -40,7 +40,8 @@ class Button:
         """| Draws the button, changing color on hover| """
         color = self.hover_color if self.rect.collidepoint(cursor_position) else self.default_color
         pygame.draw.rect(target_screen, color, self.rect)
-        text_surface = self.font.render(self.label, True, self.label_color)
+        font_name, font_size = self.font
+        text_surface = text_cache.render(self.label, font_size, self.label_color, name=font_name, sysfont=True)
         text_x = self.rect.x + (self.rect.width - text_surface.get_width()) // 2
         text_y = self.rect.y + (self.rect.height - text_surface.get_height()) // 2
         target_screen.blit(text_surface, (text_x, text_y))
@@ -53,7 +54,8 @@ class Button:
 class UIManager:
     """| Handles rendering of UI elements like questions and messages |"""
 
-    def __init__(self):
+    def __init__(self, question_font):
+        self.font = question_font
         self.question = ""
         self.sub_message = ""
         self.final_message = False  # Tracks when the final state is shown
@@ -66,14 +68,16 @@ class UIManager:
     def draw(self, window):
         """Draws the question and sub-message in the center of the top half of the screen."""
         # Draw the main question
-        question_surface = question_font.render(self.question, True, BLACK)
+        font_name, font_size = self.font
+        question_surface = text_cache.render(self.question, font_size, BLACK, name=font_name, sysfont=True)
         question_x = (SCREEN_WIDTH - question_surface.get_width()) // 2
         question_y = (SCREEN_HEIGHT // 2 - question_surface.get_height()) // 2  # Center in top half
         window.blit(question_surface, (question_x, question_y))
 
         # Draw sub-message below the question
         if self.sub_message:
-            sub_message_surface = question_font.render(self.sub_message, True, BLACK)
+            sub_message_surface = text_cache.render(self.sub_message, font_size, BLACK, name=font_name,
+                                                    sysfont=True)
             sub_message_x = (SCREEN_WIDTH - sub_message_surface.get_width()) // 2
             sub_message_y = question_y + question_surface.get_height() + 10  # Offset slightly below
             window.blit(sub_message_surface, (sub_message_x, sub_message_y))
@@ -82,7 +86,10 @@ class UIManager:
 class GameManager:
     """Manages the game state and transitions."""
 
-    def __init__(self):
+    def __init__(self, yes_button, no_button, grades):
+        self.yes_button = yes_button
+        self.no_button = no_button
+        self.grades = grades
         self.state = "main"  # Default state at startup
         self.exit_triggered = False  # Added to track if we should exit after timeout
 
@@ -90,14 +97,14 @@ class GameManager:
         """Handles events for the current game state."""
         if self.state == "main":
             # Handle clicks in the "main" state
-            if yes_button.is_clicked(cursor_position, input_event):
+            if self.yes_button.is_clicked(cursor_position, input_event):
                 self.state = "grades"
                 interface_manager.set_question("What grade will you give to the project?")
-            elif no_button.rect.collidepoint(cursor_position):
-                move_button(no_button, [no_button, yes_button])
+            elif self.no_button.rect.collidepoint(cursor_position):
+                move_button(self.no_button, [self.no_button, self.yes_button])
         elif self.state == "grades":
             # Handle clicks in the "grades" state
-            for grade_button in grades:
+            for grade_button in self.grades:
                 if grade_button.is_clicked(cursor_position, input_event):
                     if grade_button.label == "5":  # If grade 5 is chosen
                         interface_manager.set_question(
@@ -106,25 +113,25 @@ class GameManager:
                         )
                         self.exit_triggered = True  # Prepare to exit
                 elif grade_button.rect.collidepoint(cursor_position) and grade_button.label != "5":
-                    move_button(grade_button, grades)
+                    move_button(grade_button, self.grades)
 
-    def draw_buttons(self, pointer_position):
+    def draw_buttons(self, screen, pointer_position):
         """Draws the appropriate buttons for each game state."""
         if self.state == "main":
-            yes_button.draw(screen, pointer_position)
-            no_button.draw(screen, pointer_position)
+            self.yes_button.draw(screen, pointer_position)
+            self.no_button.draw(screen, pointer_position)
         elif self.state == "grades":
-            for grade_button in grades:
+            for grade_button in self.grades:
                 grade_button.draw(screen, pointer_position)
 
 
-def create_button(x, y, width, height, label, is_special=False):
+def create_button(x, y, width, height, label, button_font, is_special=False):
     """Creates and returns a Button with specified properties."""
     if is_special:
         default_color, hover_color = GREEN, LIGHT_GREEN
     else:
         default_color, hover_color = RED, LIGHT_RED
-    return Button(x, y, width, height, label, default_color, hover_color, BLACK, main_font)
+    return Button(x, y, width, height, label, default_color, hover_color, BLACK, button_font)
 
 
 def move_button(button, all_buttons):
@@ -144,48 +151,90 @@ def move_button(button, all_buttons):
             break
 
 
-# Button setup
-yes_button = create_button(150, 250, 100, 50, "Yes", is_special=True)
-no_button = create_button(350, 250, 100, 50, "No", is_special=False)
-grades = [
-    create_button(50 + (100 * (i - 1)), SCREEN_HEIGHT // 2 + 50, 50, 50, str(i), is_special=(i == 5))
-    for i in range(1, 6)
-]
+class DialogScene(Scene):
+    """| The grading dialog, runnable in its own window or inside the adventure |"""
+
+    caption = CAPTION
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    event_driven = True  # Only input (and the exit timer) changes the dialog
+    idle_timeout = 100  # Wake up regularly to check the exit timer
+
+    def __init__(self):
+        super().__init__()
+
+        # Button setup
+        yes_button = create_button(150, 250, 100, 50, "Yes", MAIN_FONT, is_special=True)
+        no_button = create_button(350, 250, 100, 50, "No", MAIN_FONT, is_special=False)
+        grades = [
+            create_button(50 + (100 * (i - 1)), SCREEN_HEIGHT // 2 + 50, 50, 50, str(i), MAIN_FONT,
+                          is_special=(i == 5))
+            for i in range(1, 6)
+        ]
+
+        # Instantiate classes for UI and game management
+        self.ui_manager = UIManager(QUESTION_FONT)
+        self.game_manager = GameManager(yes_button, no_button, grades)
+
+        # Set initial question
+        self.ui_manager.set_question("Are you ready to grade the project?")
+
+        self.exit_timer = None  # Timer to track the 5-second delay before exiting
+
+    def handle_event(self, event):
+        """Passes an input event to the game manager."""
+        self.game_manager.handle_event(event, self.mouse_pos, self.ui_manager)
+
+    def update(self):
+        """Finishes the dialog 5 seconds after the final answer."""
+        # If exit is triggered, initialize the timer
+        if self.game_manager.exit_triggered and not self.exit_timer:
+            self.exit_timer = time.time()
+
+        # Check if the timer has reached 5 seconds and exit
+        if self.exit_timer and time.time() - self.exit_timer >= 5:
+            self.finish()
+
+    def draw(self, surface):
+        """Draws the UI elements and buttons."""
+        surface.fill(WHITE)
+        self.ui_manager.draw(surface)
+        self.game_manager.draw_buttons(surface, self.mouse_pos)
+
 
-# Instantiate classes for UI and game management
-ui_manager = UIManager()
-game_manager = GameManager()
+def main():
+    """Runs the dialog in its own window."""
+    # Initialize pygame
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(CAPTION)
 
-# Set initial question
-ui_manager.set_question("Are you ready to grade the project?")
+    clock = pygame.time.Clock()
+    dialog = DialogScene()
+    events = []
 
-# Main game loop
-running = True
-exit_timer = None  # Timer to track the 5-second delay before exiting
+    # Main game loop
+    while not dialog.finished:
+        dialog.mouse_pos = pygame.mouse.get_pos()
 
-while running:
-    screen.fill(WHITE)
-    mouse_position = pygame.mouse.get_pos()
+        for event in events + pygame.event.get():
+            if event.type == pygame.QUIT:
+                dialog.finish()  # Exit game
+            dialog.handle_event(event)
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False  # Exit game
-        game_manager.handle_event(event, mouse_position, ui_manager)
+        dialog.update()
+        dialog.draw(screen)
 
-    # If exit is triggered, initialize the timer
-    if game_manager.exit_triggered and not exit_timer:
-        exit_timer = time.time()
+        # Update the screen and cap the frame rate
+        pygame.display.flip()
+        clock.tick(30)
 
-    # Check if the timer has reached 5 seconds and exit
-    if exit_timer and time.time() - exit_timer >= 5:
-        running = False
+        # Sleep until input arrives or it is time to check the exit timer again
+        event = wait_for_event(dialog.idle_timeout)
+        events = [event] if event is not None else []
 
-    # Draw the UI elements and buttons
-    ui_manager.draw(screen)
-    game_manager.draw_buttons(mouse_position)
+    # Quit pygame
+    pygame.quit()
 
-    # Update the screen
-    pygame.display.flip()
 
-# Quit pygame
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
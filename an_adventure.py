@@ -1,10 +1,22 @@
-import math
+from startup import startup_timer  # First, so the startup report covers every import
+
 import sys
 import pygame
 
 from settings import Settings
 from human import Human
 from enemy import Enemy
+from assets import assets
+from text_cache import text_cache
+from scenes import SceneStack
+from renderer import DirtyRenderer
+from event_wait import wait_for_event
+from triggers import TriggerZones
+from entities import create_entity_store
+from profiler import FrameProfiler, ProfilerOverlay
+
+# The mini-games and maze levels are imported when first used, so they do not delay the first frame
+startup_timer.mark('imports')
 
 
 class AnAdventure:
@@ -12,146 +24,219 @@ class AnAdventure:
 
     def __init__(self):
         """Initialize the game, and create game resources."""
-        pygame.init()
+        # Only the subsystems the game uses (the display brings events with it); no audio or joysticks
+        pygame.display.init()
+        pygame.font.init()
+        startup_timer.mark('pygame init')
+
         self.clock = pygame.time.Clock()
         self.settings = Settings()
         self.screen = pygame.display.set_mode(
             (self.settings.screen_width, self.settings.screen_height))  # Windowed mode
         pygame.display.set_caption("An Adventure")
+        startup_timer.mark('display')
+
+        # Positions, velocities and sizes of every entity, updated in one batch per frame
+        self.entities = create_entity_store(self.screen.get_size())
 
         # Create main game objects
         self.human = Human(self)
 
-        # First enemy at default location.
-        self.enemy = Enemy(self)
+        # Enemies, and the proximity zones that start their encounters
+        self.enemies = []
+        self.triggers = TriggerZones(self.settings.trigger_radius)
+
+        # First enemy at default location; he plays Blackjack.
+        self.add_enemy(Enemy(self, encounter='blackjack'))
 
         # Adjust enemy position to be precisely in the bottom-right corner
         enemy_image_path = 'images/enemy2.bmp'  # Path to the enemy image
-        temp_enemy = Enemy(self, image_path=enemy_image_path)  # Temporarily load to get rect dimensions
-        enemy_x = self.settings.screen_width - temp_enemy.rect.width
-        enemy_y = self.settings.screen_height - temp_enemy.rect.height
-        self.second_enemy = Enemy(self, x=enemy_x, y=enemy_y, image_path=enemy_image_path)
+        enemy_width, enemy_height = assets.image_size(enemy_image_path)  # Cached, so it is decoded only once
+        enemy_x = self.settings.screen_width - enemy_width
+        enemy_y = self.settings.screen_height - enemy_height
+        self.add_enemy(Enemy(self, x=enemy_x, y=enemy_y, image_path=enemy_image_path, encounter='dialog'))
+
+        # Per-phase frame timings; F3 shows them in an overlay
+        self.profiler = FrameProfiler(enabled=self.settings.profiler_enabled)
+        self.profiler_overlay = None
+
+        # Only the areas that sprites touch are redrawn each frame
+        self.renderer = DirtyRenderer(self.screen, self.settings.bg_color, profiler=self.profiler)
+
+        # The maze the game is played in, if any
+        self.level = None
+        if self.settings.maze_level:
+            self.load_maze_level(self.settings.maze_seed)
+
+        # Mini-games (Blackjack, Dialog) run as scenes on this screen
+        self.scenes = SceneStack(self.screen)
+        self._held_events = []  # Events received while a scene was waiting for input
 
         self.running = True
         self.paused = False
-        self.blackjack_triggered = False
+        self._accumulator = 0.0  # Simulation time not yet run as a fixed tick (seconds)
+        self._pause_frame = None  # Dimmed snapshot of the world shown while paused
+        self._overlay = None  # Reusable full-screen dim overlay
+        startup_timer.mark('world')
+
+    def add_enemy(self, enemy):
+        """| Place an enemy in the world along with its trigger zone |"""
+        self.enemies.append(enemy)
+        self.triggers.add(enemy)
+
+    def remove_enemy(self, enemy):
+        """| Take an enemy and its trigger zone out of the world |"""
+        self.enemies.remove(enemy)
+        self.triggers.remove(enemy)
+        enemy.release()
+        self.renderer.invalidate()  # Clear where it was drawn
+
+    def load_level(self, level):
+        """| Play inside a level: draw its background and move every entity to the middle of its cell |"""
+        self.level = level
+        self.human.level = level
+        self.renderer.set_background(level.background)
+
+        for entity in self._sprites():
+            rect = entity.rect
+            col, row = level.cell_at(*rect.center)
+            col, row = min(col, level.maze.cols - 1), min(row, level.maze.rows - 1)
+            self.entities.place(entity.index, *level.centered_in_cell(col, row, rect.width, rect.height))
+        for enemy in self.enemies:
+            self.triggers.add(enemy)  # Re-position its trigger zone
+
+    def load_maze_level(self, seed=None):
+        """| Generate a maze that fills the screen and load it as the level |"""
+        from labyrinth import generate_maze
+        from level import MazeLevel
+
+        tile = self.settings.maze_tile
+        maze = generate_maze(self.settings.screen_width // tile, self.settings.screen_height // tile, seed=seed)
+        self.load_level(MazeLevel(maze, tile, self.screen.get_size(), self.settings.bg_color))
+
+    def _sprites(self):
+        """| Return the game entities in drawing order |"""
+        return [self.human] + self.enemies
 
     def _update_screen(self):
-        """Update all images on the screen and flip to the new screen."""
-        self.screen.fill(self.settings.bg_color)
-
-        # Draw game entities.
-        self.human.blitme()  # Draw the player
-        if self.enemy:  # First enemy
-            self.enemy.blitme()
-        if self.second_enemy:  # Second enemy
-            self.second_enemy.blitme()
-
-        pygame.display.flip()
+        """Redraw the areas of the screen that changed and push only those to the display."""
+        self.renderer.render(self._sprites())
+        if self.profiler_overlay:
+            pygame.display.update(self.profiler_overlay.draw(self.screen))
+        self.profiler.mark('display')
+
+    def toggle_profiler(self):
+        """| Show or hide the frame profiler overlay; timings are only recorded while it is shown |"""
+        if self.profiler_overlay is None:
+            self.profiler.enabled = True
+            self.profiler_overlay = ProfilerOverlay(self.profiler)
+        else:
+            self.profiler.enabled = self.settings.profiler_enabled
+            self.profiler_overlay = None
+        self.renderer.invalidate()  # Clear (or draw) the overlay area
 
     def run_game(self):
         """| Start the main loop for the game |"""
         # Show the start screen
         self.show_start_screen()
+        self.clock.tick()  # Don't count the start screen as frame time
 
-        while self.running:
-            self._check_events()
-
-            if not self.paused:
-                # Normal game logic
-                player_moved = self.human.update()  # Check if human moved
-
-                if self.human:
-                    player_moved = self.human.update()  # Ensure self.human is not None
-
-                if self.enemy is not None and player_moved:  # Only calculate if the player moved
-                    self.enemy.update()
-                    distance = self._calculate_distance(self.human, self.enemy)
-
-                    # Trigger monster battle
-                    if distance <= 70 and not self.blackjack_triggered:
-                        print("Monster radius triggered! Game Paused, Starting Blackjack...")
-                        self.blackjack_triggered = True
-
-                        # Pause the game and show the pause screen immediately
-                        self.paused = True  # Manually pause
-                        self.show_pause_menu()  # Display the pause menu
-                        pygame.time.delay(500)  # Optional small delay for user feedback (0.5s)
-
-                        # Start the Blackjack game
-                        self._start_blackjack_game()
-
-                        # After returning from Blackjack, remove the monster
-                        self.enemy = None  # Remove monster
-                        self.paused = False  # Automatically resume the game
-
-                # Add logic for the second enemy
-                if self.second_enemy is not None and player_moved:
-                    distance_to_second_enemy = self._calculate_distance(self.human, self.second_enemy)
-
-                    if distance_to_second_enemy <= 70:  # Adjust the radius as needed
-                        print("Second enemy detected! Pausing game and starting dialog...")
-                        self.paused = True  # Manually pause the game
-                        self.show_pause_menu()
-                        pygame.time.delay(500)
-
-                        # Launch Dialog.py
-                        self._start_dialog()
-
-                        # self.second_enemy = None  # Remove second enemy after the dialog ends
-                        self.paused = False
+        try:
+            while self.running:
+                self._run_frame()
+        finally:
+            # Runs on every way out of the game, including sys.exit() from the quit prompt
+            if self.profiler.dump_chrome_trace(self.settings.profile_trace_path):
+                print(f"Frame trace written to {self.settings.profile_trace_path}")
 
-                self._update_screen()
+        pygame.quit()
+        sys.exit()
 
-            else:
-                self.show_pause_menu()  # Show the updated pause menu while paused
+    def _run_frame(self):
+        """| Run one rendered frame: input, as many simulation ticks as are due, then drawing |"""
+        frame_time = self.clock.tick(self.settings.fps) / 1000  # Caps the frame rate (0 = uncapped)
+        self.profiler.begin_frame()  # Scene and paused frames are never ended, so they are not recorded
 
-            self.clock.tick(self.settings.fps)  # Maintain consistent FPS
+        if self.scenes:
+            self._run_scene_frame()
+            self._resync_clock()
+            return
 
-        pygame.quit()
-        sys.exit()
+        self._check_events()
+        self.profiler.mark('events')
 
-    def display_message_screen(self, title, message_lines, continue_message):
-        """Generalized method to display a screen with a title, messages, and a 'Press any key' prompt."""
+        if self.paused:
+            self._wait_while_paused()  # Sleep until input arrives
+            self._resync_clock()
+            return
+
+        # Run the simulation at a fixed rate: a slow frame runs several ticks rather than slowing the game
+        tick = 1 / self.settings.tick_rate
+        self._accumulator += min(frame_time, self.settings.max_frame_time)
+        while self._accumulator >= tick and not (self.paused or self.scenes):
+            self._accumulator -= tick
+            self._simulate_tick()
+
+        if not (self.paused or self.scenes):
+            # Draw entities part-way between the last two ticks for smooth motion
+            self.entities.interpolate(self._accumulator / tick)
+            self._update_screen()
+            self.profiler.end_frame()
+
+    def _simulate_tick(self):
+        """| Advance the game world by one fixed simulation tick |"""
+        self.human.update()  # Steer the human from the movement flags
+        moved = self.entities.step()  # Move and clamp every entity at once
+        self.profiler.mark('simulate')
+        if moved[self.human.index]:  # Only check the trigger zones if the player moved
+            self._check_triggers()
+            self.profiler.mark('triggers')
+
+    def _resync_clock(self):
+        """| Forget time spent in scenes or paused, so the simulation does not try to catch up on it |"""
+        self._accumulator = 0.0
+        self.clock.tick()
+
+    def display_message_screen(self, title, message_lines, continue_message, wait=True):
+        """
+        Generalized method to display a screen with a title, messages, and a 'Press any key' prompt.
+        :param wait: Wait for a key press before returning.
+        """
         self.screen.fill(self.settings.bg_color)  # Fill the screen with background color
 
         # Render the title
-        font_title = pygame.font.Font(None, 74)
-        title_text = font_title.render(title, True, (0, 0, 0))  # Black text for title
+        title_text = text_cache.render(title, 74, (0, 0, 0))  # Black text for title
         title_x = (self.settings.screen_width - title_text.get_width()) // 2
         title_y = 50
         self.screen.blit(title_text, (title_x, title_y))
 
         # Render the message lines
-        font_message = pygame.font.Font(None, 36)
         y_offset = 150
         for line in message_lines:
-            message_text = font_message.render(line, True, (0, 0, 0))  # Black text for message
+            message_text = text_cache.render(line, 36, (0, 0, 0))  # Black text for message
             message_x = (self.settings.screen_width - message_text.get_width()) // 2
             self.screen.blit(message_text, (message_x, y_offset))
             y_offset += 40  # Adjust line spacing as needed
 
         # Render the continue message
-        font_continue = pygame.font.Font(None, 48)
-        continue_text = font_continue.render(continue_message, True, (0, 100, 20))  # Green text for 'Press any key'
+        continue_text = text_cache.render(continue_message, 48, (0, 100, 20))  # Green text for 'Press any key'
         continue_x = (self.settings.screen_width - continue_text.get_width()) // 2
         continue_y = self.settings.screen_height - 100
         self.screen.blit(continue_text, (continue_x, continue_y))
 
         # Update the screen
         pygame.display.flip()
+        self.renderer.invalidate()  # The world view has been drawn over
+        if not wait:
+            return
+
+        # Sleep until any key press (continue) or the window is closed
+        event = wait_for_event(event_types=(pygame.QUIT, pygame.KEYDOWN))
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
 
-        # Wait for any key press
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:  # Continue on any key press
-                    waiting = False
-
-    def show_start_screen(self):
+    def show_start_screen(self, wait=True):
         """Display the start screen using the generalized display method."""
         title = "An Adventure"
         message_lines = [
@@ -162,7 +247,7 @@ class AnAdventure:
             "4. Press 'Q' to quit at any time."
         ]
         continue_message = "Press any key to start the game"
-        self.display_message_screen(title, message_lines, continue_message)
+        self.display_message_screen(title, message_lines, continue_message, wait)
 
     def toggle_pause(self):
         """Toggle the pause state of the game."""
@@ -170,37 +255,53 @@ class AnAdventure:
 
         if self.paused:
             print("The game is now paused.")
+            self.show_pause_menu()
         else:
             print("The game has resumed.")
+            self._pause_frame = None  # Drop the snapshot; the world may change before the next pause
             # Reset human movement when resuming the game
             self.human.reset_movement()
 
     def show_pause_menu(self):
-        """| Display a pause menu |"""
+        """| Build the pause menu from a snapshot of the world and display it once |"""
 
         # Redraw the existing game screen (to ensure the game state shows correctly even when paused)
-        self.screen.fill(self.settings.bg_color)  # Refill the screen with the background color
-        self.human.blitme()  # Draw the player
-        if self.enemy:  # Draw the monster if it still exists
-            self.enemy.blitme()
+        self.renderer.clear()  # Refill the screen with the background (color or level)
+        for sprite in self._sprites():  # Draw the player and every remaining enemy
+            sprite.blitme()
 
         # Add a transparent dim overlay over the screen
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(128)  # Transparency level (0=fully transparent, 255=opaque)
-        overlay.fill((0, 0, 0))  # Black overlay
-        self.screen.blit(overlay, (0, 0))
+        if self._overlay is None:
+            self._overlay = pygame.Surface(self.screen.get_size()).convert()
+            self._overlay.set_alpha(128)  # Transparency level (0=fully transparent, 255=opaque)
+            self._overlay.fill((0, 0, 0))  # Black overlay
+        self.screen.blit(self._overlay, (0, 0))
 
         # Render the "Paused" text at the center of the screen
-        font = pygame.font.Font(None, 74)
-        text = font.render("Paused", True, (255, 255, 255))  # White text
+        text = text_cache.render("Paused", 74, (255, 255, 255))  # White text
 
         # Center the paused text in the middle of the screen
         pause_x = (self.settings.screen_width - text.get_width()) // 2
         pause_y = (self.settings.screen_height - text.get_height()) // 2
         self.screen.blit(text, (pause_x, pause_y))
+        self._pause_frame = self.screen.copy()  # Keep the composite to restore it without redrawing
 
         # Update the display to show the paused menu
         pygame.display.flip()
+        self.renderer.invalidate()  # The world view has been drawn over
+
+    def _wait_while_paused(self):
+        """| Block until an input event arrives, then handle it; the pause menu is not redrawn |"""
+        if self._pause_frame is None:
+            self.show_pause_menu()
+
+        event = wait_for_event()
+        self._check_event(event)
+
+        # Restore the pause menu if something (e.g. the quit prompt) drew over it
+        if self.paused and event.type in (pygame.KEYDOWN, pygame.WINDOWEXPOSED):
+            self.screen.blit(self._pause_frame, (0, 0))
+            pygame.display.flip()
 
     def show_custom_message(self):
         """Display a custom message before showing the Blackjack rules."""
@@ -224,7 +325,8 @@ class AnAdventure:
             "4. Choose 'More' to draw another card or 'Stop' to hold.",
             "5. Dealer must draw until their total is at least 17.",
             "6. If you exceed 21, you lose the round.",
-            "7. You can shuffle the deck up to 3 times for 'luck'."
+            "7. You can shuffle the deck up to 3 times for 'luck'.",
+            "8. Press H during your turn for a hint on the best play."
         ]
         continue_message = "Press any key to continue to Blackjack"
         self.display_message_screen(title, message_lines, continue_message)
@@ -233,14 +335,16 @@ class AnAdventure:
         """| Respond to key presses and mouse events |"""
         # Tracking keyboard and mouse events (event is an action that the user performs - pressing a key or moving the mouse)
         for event in pygame.event.get():  # To access the events that Pygame detects
-            if event.type == pygame.QUIT:
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                self._check_keydown_events(event)
-            elif event.type == pygame.KEYUP:
-                self._check_keyup_events(event)
-            if event.type == pygame.QUIT:
-                self.running = False
+            self._check_event(event)
+
+    def _check_event(self, event):
+        """| Respond to a single event |"""
+        if event.type == pygame.QUIT:
+            sys.exit()
+        elif event.type == pygame.KEYDOWN:
+            self._check_keydown_events(event)
+        elif event.type == pygame.KEYUP:
+            self._check_keyup_events(event)
 
     def _check_keydown_events(self, event):
         """| Respond to key presses |"""
@@ -256,6 +360,8 @@ class AnAdventure:
             self._confirm_exit()
         elif event.key == pygame.K_p:
             self.toggle_pause()
+        elif event.key == pygame.K_F3:
+            self.toggle_profiler()
 
     def _check_keyup_events(self, event):
         """| Respond to key releases |"""
@@ -270,36 +376,73 @@ class AnAdventure:
 
     def _confirm_exit(self):
         """| Confirm exit when 'q' key is pressed |"""
-        font = pygame.font.Font(None, 36)
-        text = font.render("Quit? Press (Q)uit / (Y)es / (ESC)ape to leave or (N)o to stay", True, (0, 0, 0))
+        text = text_cache.render("Quit? Press (Q)uit / (Y)es / (ESC)ape to leave or (N)o to stay", 36, (0, 0, 0))
         print("One of escape keys pressed - escaping")
         self.screen.blit(text, (50, 50))
         pygame.display.flip()
+        self.renderer.invalidate()  # The world view has been drawn over
 
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_y or event.key == pygame.K_q or event.key == pygame.K_ESCAPE:  # Yes / Q / Esc to quit
-                        pygame.quit()
-                        sys.exit()
-                    elif event.key == pygame.K_n:  # No to exit confirmation
-                        return
-
-    def _calculate_distance(self, obj1, obj2):
-        """| Calculate the distance between two objects |"""
-        dx = obj1.rect.centerx - obj2.rect.centerx
-        dy = obj1.rect.centery - obj2.rect.centery
-        distance = math.sqrt(dx ** 2 + dy ** 2)
-        distance = int(round(distance))
-        #print(f"Calculated distance: {distance}")  # Debugging print
-        return distance
-
-    def _start_blackjack_game(self):
-        """Start the Blackjack game in a new window and pause the adventure game."""
-        import subprocess
-        import os
+            event = wait_for_event(event_types=(pygame.QUIT, pygame.KEYDOWN))  # Sleep until input
+            if event.type == pygame.QUIT:
+                sys.exit()
+            if event.key == pygame.K_y or event.key == pygame.K_q or event.key == pygame.K_ESCAPE:  # Yes / Q / Esc to quit
+                pygame.quit()
+                sys.exit()
+            elif event.key == pygame.K_n:  # No to exit confirmation
+                return
+
+    def _check_triggers(self):
+        """| Start the encounter of any enemy whose zone the player just entered |"""
+        entered, _ = self.triggers.update(self.human)
+        for enemy in entered:
+            if enemy.encounter == 'blackjack':
+                # Trigger monster battle
+                print("Monster radius triggered! Game Paused, Starting Blackjack...")
+
+                # Pause the game and show the pause screen immediately
+                self.paused = True  # Manually pause
+                self.show_pause_menu()  # Display the pause menu
+                pygame.time.delay(500)  # Optional small delay for user feedback (0.5s)
+
+                # Start the Blackjack game; the monster is removed once it ends
+                self._start_blackjack_game(enemy)
+                return
+            elif enemy.encounter == 'dialog':
+                print("Second enemy detected! Pausing game and starting dialog...")
+                self.paused = True  # Manually pause the game
+                self.show_pause_menu()
+                pygame.time.delay(500)
+
+                # Launch the dialog; the game exits once it ends
+                self._start_dialog()
+                return
+
+    def _run_scene_frame(self):
+        """| Run one frame of the active scene on the adventure screen |"""
+        events = self._held_events + pygame.event.get()
+        self._held_events = []
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            self.scenes.handle_event(event)
+
+        if self.scenes.update():
+            self.scenes.draw()
+            pygame.display.flip()
+
+            # A scene that only changes on input sleeps until the next event
+            scene = self.scenes.top
+            if scene.event_driven:
+                event = wait_for_event(scene.idle_timeout)
+                if event is not None:
+                    self._held_events.append(event)
+        self.renderer.invalidate()  # Redraw the whole world view once the scene ends
+
+    def _start_blackjack_game(self, enemy):
+        """Start the Blackjack game as a scene and pause the adventure game."""
+        from blackjack import BlackjackGame
 
         print("Displaying custom message...")  # Debug log
         self.show_custom_message()  # Show the custom message window first
@@ -309,21 +452,13 @@ class AnAdventure:
 
         print("Starting Blackjack...")  # Debug log
         self.paused = True  # Pause the game while Blackjack runs
+        game = BlackjackGame(self.screen, self.settings.blackjack_decks, self.settings.blackjack_penetration)
+        self.scenes.push(game, on_finish=lambda blackjack: self._end_blackjack_game(enemy))
 
-        # Define the path to the Blackjack script
-        blackjack_path = os.path.join(os.path.dirname(__file__), 'blackjack.py')
-
-        # Check if the Blackjack script exists
-        if not os.path.exists(blackjack_path):
-            print(f"Error: blackjack.py not found at {blackjack_path}. Please ensure the file exists.")
-            return  # Exit if the script does not exist
-
-        try:
-            subprocess.run(["python", blackjack_path])  # Launch Blackjack game
-        except FileNotFoundError:
-            print(f"Error: blackjack.py not found at {blackjack_path}!")
-        except Exception as e:
-            print(f"Unexpected error occurred: {e}")
+    def _end_blackjack_game(self, enemy):
+        """Remove the monster and resume the adventure once Blackjack ends."""
+        # After returning from Blackjack, remove the monster
+        self.remove_enemy(enemy)
 
         # Reset player movement after Blackjack
         self.human.reset_movement()
@@ -333,34 +468,38 @@ class AnAdventure:
         self.paused = False
 
     def _start_dialog(self):
-        """Start the Dialog game in a new window and pause the adventure game."""
-        import subprocess
-        import os
+        """Start the Dialog game as a scene and pause the adventure game."""
+        from Dialog import DialogScene
 
         print("Launching dialog...")  # Debugging print
         self.paused = True  # Pause the game while the dialog runs
+        self.scenes.push(DialogScene(), on_finish=self._end_dialog)
 
-        try:
-            # Dialog logic
-            dialog_path = os.path.join(os.path.dirname(__file__), 'Dialog.py')
-            if not os.path.exists(dialog_path):
-                print(f"Error: Dialog.py not found at {dialog_path}. Please ensure the file exists.")
-                return
+    def _end_dialog(self, dialog):
+        """Exit the adventure once the dialog ends."""
+        print("Dialog finished. Exiting the game...")
+        self.running = False  # This will stop the main game loop in `run_game`
 
-            # Run Dialog.py and wait for it to finish
-            subprocess.run(["python", dialog_path], check=True)
 
-            # After Dialog.py finishes, exit the current game
-            print("Dialog finished. Exiting the game...")
-            self.running = False  # This will stop the main game loop in `run_game`
+def main(argv=None):
+    """| Parse the command line and run the game |"""
+    import argparse
 
-        except FileNotFoundError:
-            print("Dialog.py file not found or path is incorrect!")
-        except Exception as e:
-            print(f"An unexpected error occurred when starting Dialog: {e}")
+    parser = argparse.ArgumentParser(description="An Adventure.")
+    parser.add_argument('--startup-report', nargs='?', const='text', choices=('text', 'json'),
+                        help="show the start screen, print where startup time went and exit")
+    args = parser.parse_args(argv)
 
-
-if __name__ == "__main__":
     # Make a game instance, run the game
     adventure = AnAdventure()
+    if args.startup_report:
+        adventure.show_start_screen(wait=False)
+        startup_timer.mark('first frame')
+        print(startup_timer.report() if args.startup_report == 'text' else startup_timer.to_json())
+        pygame.quit()
+        return
     adventure.run_game()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from pygame.surface import Surface
+import pygame
+
+
+class AssetManager:
+    """| Central cache of loaded images, keyed by path |"""
+
+    def __init__(self) -> None:
+        """| Initialize an empty image cache |"""
+        self._images: dict = {}  # path -> Surface (display format once a display exists)
+        self._converted: set = set()  # Paths whose surfaces are already in display format
+
+    def load_image(self, image_path: str) -> Surface:
+        """
+        Return the shared surface for an image, loading it on first use.
+        The surface is converted to the display format as soon as a display mode is set,
+        so blitting it does not pay for a per-pixel format conversion.
+        """
+        image = self._images.get(image_path)
+        if image is None:
+            image = pygame.image.load(image_path)
+            self._images[image_path] = image
+
+        if image_path not in self._converted and pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+            self._images[image_path] = image
+            self._converted.add(image_path)
+        return image
+
+    def image_size(self, image_path: str) -> tuple:
+        """| Return the (width, height) of an image without creating a sprite for it |"""
+        return self.load_image(image_path).get_size()
+
+    def clear(self) -> None:
+        """| Drop every cached surface (e.g. after the display mode changes) |"""
+        self._images.clear()
+        self._converted.clear()
+
+
+# Shared by every entity so each image is decoded and converted only once
+assets = AssetManager()
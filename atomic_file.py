@@ -0,0 +1,20 @@
+import os
+
+
+def write_atomically(path, write, suffix='.tmp'):
+    """
+    Write a file through a temporary file next to it, then move it into place in one step.
+    Readers never see a half-written file, two processes writing the same path cannot interleave,
+    and a file still memory-mapped from the old version is never truncated under its reader.
+    :param path: File to create or replace.
+    :param write: Called with the temporary path; must write the whole file there.
+    :param suffix: End of the temporary name (e.g. '.tmp.bmp' where the extension picks the format).
+    """
+    temporary = f"{path}.{os.getpid()}{suffix}"
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)  # Don't leave a partial file behind
+        raise
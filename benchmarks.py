@@ -0,0 +1,398 @@
+"""
+Headless benchmarks for the game loops.
+
+Runs every scenario under SDL's dummy video driver with scripted input and no frame cap,
+then writes frames per second, per-frame time percentiles and peak memory to a JSON file:
+
+    python benchmarks.py                       # all scenarios, results in benchmark_results.json
+    python benchmarks.py idle movement -f 500  # selected scenarios, 500 frames each
+    python benchmarks.py --baseline old.json   # exit with status 1 if p95 frame time regressed
+
+Every run also launches the game a few times in fresh processes and times how long the first frame
+takes to appear; the run fails (status 1) if the median is over the startup budget.
+"""
+import os
+
+# Must be set before pygame creates a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+SCENARIOS = {}
+STARTUP_BUDGET_MS = 750  # Launch to first frame, including Python's own startup
+
+
+def scenario(name):
+    """| Register a scenario: a function that sets it up and returns a callable running one frame |"""
+    def register(setup):
+        SCENARIOS[name] = setup
+        return setup
+    return register
+
+
+def _post_key(event_type, key):
+    pygame.event.post(pygame.event.Event(event_type, key=key, mod=0, unicode='', scancode=0))
+
+
+def _post_mouse(event_type, pos, **attributes):
+    pygame.event.post(pygame.event.Event(event_type, pos=pos, **attributes))
+
+
+def _new_adventure():
+    """| Create an AnAdventure ready to be driven frame by frame |"""
+    from an_adventure import AnAdventure
+
+    game = AnAdventure()
+    game.settings.fps = 0  # No frame cap
+    pygame.event.clear()
+    return game
+
+
+def _adventure_frame(game):
+    """
+    | Run one adventure frame with exactly one simulation tick |
+    Driving the tick directly (instead of from the wall clock) makes every run do the same work.
+    """
+    game._check_events()
+    game._simulate_tick()
+    game.entities.interpolate(1.0)
+    game._update_screen()
+
+
+@scenario('idle')
+def idle():
+    """| The world view with nobody moving |"""
+    game = _new_adventure()
+    return lambda frame: _adventure_frame(game)
+
+
+def _walk_top_row(game):
+    """| Return a frame function that walks the human back and forth along the top of the screen |"""
+    def frame(frame_number):
+        # Turn around every 120 ticks; the top row is clear of every encounter
+        if frame_number % 240 == 0:
+            _post_key(pygame.KEYUP, pygame.K_LEFT)
+            _post_key(pygame.KEYDOWN, pygame.K_RIGHT)
+        elif frame_number % 240 == 120:
+            _post_key(pygame.KEYUP, pygame.K_RIGHT)
+            _post_key(pygame.KEYDOWN, pygame.K_LEFT)
+        _adventure_frame(game)
+    return frame
+
+
+@scenario('movement')
+def movement():
+    """| The human constantly moving |"""
+    return _walk_top_row(_new_adventure())
+
+
+@scenario('enemies_1000')
+def enemies_1000():
+    """| The human moving on a map with 1,000 extra enemies |"""
+    from enemy import Enemy
+
+    game = _new_adventure()
+    rng = random.Random(1)
+    for _ in range(1000):
+        # Keep the top row free so the walk never starts an encounter
+        game.add_enemy(Enemy(game, x=rng.randint(0, game.settings.screen_width - 50),
+                             y=rng.randint(150, game.settings.screen_height - 50)))
+    return _walk_top_row(game)
+
+
+@scenario('maze_level')
+def maze_level():
+    """| The human walking (and bumping into walls) in a maze level |"""
+    game = _new_adventure()
+    game.load_maze_level(seed=1)
+    return _walk_top_row(game)
+
+
+@scenario('pause')
+def pause():
+    """| The game paused, woken by one (ignored) event per frame |"""
+    game = _new_adventure()
+    game.toggle_pause()
+
+    def frame(frame_number):
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        game._wait_while_paused()
+    return frame
+
+
+@scenario('blackjack')
+def blackjack():
+    """| A full Blackjack session: stand, replay, and continue after every 4 wins |"""
+    from blackjack import BlackjackGame, WIDTH, HEIGHT
+
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    game = BlackjackGame(screen)
+    pygame.event.clear()
+
+    def frame(frame_number):
+        if game.show_prompt:
+            _post_key(pygame.KEYDOWN, pygame.K_c)
+        elif game.player_turn:
+            button = game.more_button_rect if frame_number % 3 == 0 else game.stop_button_rect
+            _post_mouse(pygame.MOUSEBUTTONDOWN, button.center, button=1)
+        else:
+            _post_mouse(pygame.MOUSEBUTTONDOWN, game.replay_button_rect.center, button=1)
+        _post_mouse(pygame.MOUSEMOTION, (frame_number % WIDTH, 600), rel=(1, 0), buttons=(0, 0, 0))
+
+        for event in pygame.event.get():
+            game.handle_event(event)
+        game.mouse_pos = (frame_number % WIDTH, 600)
+        game.update()
+        game.draw(screen)
+        pygame.display.flip()
+    return frame
+
+
+@scenario('dialog')
+def dialog():
+    """| The grading dialog with the cursor sweeping over the buttons |"""
+    from Dialog import DialogScene, SCREEN_WIDTH, SCREEN_HEIGHT
+
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    scene = DialogScene()
+    pygame.event.clear()
+
+    def frame(frame_number):
+        position = (frame_number * 7 % SCREEN_WIDTH, SCREEN_HEIGHT // 2 + frame_number % (SCREEN_HEIGHT // 2))
+        _post_mouse(pygame.MOUSEMOTION, position, rel=(7, 1), buttons=(0, 0, 0))
+        scene.mouse_pos = position
+        for event in pygame.event.get():
+            scene.handle_event(event)
+        scene.update()
+        scene.draw(screen)
+        pygame.display.flip()
+    return frame
+
+
+@scenario('labyrinth')
+def labyrinth():
+    """| Generating a 200x200 maze every frame (no drawing) |"""
+    from labyrinth import generate_maze
+
+    return lambda frame_number: generate_maze(200, 200, seed=frame_number)
+
+
+@scenario('maze_animation')
+def maze_animation():
+    """| Animating the generation of a 300x175 maze (4 px cells), 200 steps per frame |"""
+    from labyrinth import BacktrackerSteps
+    from maze_view import MazeRenderer
+
+    tile = 4
+    screen = pygame.display.set_mode((1200, 700))
+    steps = BacktrackerSteps(1200 // tile, 700 // tile, seed=1)
+    renderer = MazeRenderer(steps.maze, tile, steps.is_visited)
+    renderer.draw_full(screen, steps.current)
+
+    def frame(frame_number):
+        changed = steps.advance(200)
+        pygame.display.update(renderer.update(screen, changed, steps.current))
+    return frame
+
+
+@scenario('maze_chase')
+def maze_chase():
+    """| 200 chasers following a distance field towards a target wandering a 500x500 maze |"""
+    from labyrinth import generate_maze
+    from maze_solver import DistanceField
+
+    maze = generate_maze(500, 500, seed=1)
+    rng = random.Random(1)
+    target = (250, 250)
+    field = DistanceField(maze, target)
+    chasers = [(rng.randrange(500), rng.randrange(500)) for _ in range(200)]
+
+    def frame(frame_number):
+        nonlocal target
+        if frame_number % 100 == 0:  # Now and then the target jumps, forcing a full recompute
+            target = (rng.randrange(500), rng.randrange(500))
+        else:
+            target = rng.choice(maze.open_neighbors(*target))
+        field.update(target)
+        for i, (x, y) in enumerate(chasers):
+            chasers[i] = field.next_step(x, y) or (x, y)
+    return frame
+
+
+def _shutdown():
+    """| Quit pygame and drop cached fonts and surfaces, which do not survive pygame.quit() |"""
+    from assets import assets
+    from text_cache import text_cache
+
+    pygame.quit()
+    assets.clear()
+    text_cache.clear()
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name, frames, measure_memory=True):
+    """| Run a scenario and return its statistics as a dictionary |"""
+    pygame.init()
+    try:
+        frame = SCENARIOS[name]()
+        frame(0)  # Warm-up frame: first draws, cache fills
+
+        frame_times = []
+        start = time.perf_counter()
+        for frame_number in range(1, frames + 1):
+            frame_start = time.perf_counter()
+            frame(frame_number)
+            frame_times.append(time.perf_counter() - frame_start)
+        total = time.perf_counter() - start
+    finally:
+        _shutdown()
+
+    peak_memory = None
+    if measure_memory:
+        # A second, traced run: tracemalloc slows allocation down too much to share the timed run
+        pygame.init()
+        tracemalloc.start()
+        try:
+            frame = SCENARIOS[name]()
+            for frame_number in range(frames):
+                frame(frame_number)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            _shutdown()
+
+    frame_times.sort()
+    to_ms = 1000
+    return {
+        'frames': frames,
+        'fps': frames / total,
+        'mean_ms': total / frames * to_ms,
+        'p50_ms': _percentile(frame_times, 0.50) * to_ms,
+        'p95_ms': _percentile(frame_times, 0.95) * to_ms,
+        'p99_ms': _percentile(frame_times, 0.99) * to_ms,
+        'max_ms': frame_times[-1] * to_ms,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def measure_startup(runs=5):
+    """
+    Launch the game in fresh processes and return time-to-first-frame statistics.
+    Each launch is timed from spawning the process until its startup report arrives, so Python's own
+    startup and every import are included; the report's in-process timeline is kept alongside.
+    """
+    command = [sys.executable, 'an_adventure.py', '--startup-report', 'json']
+    launches = []
+    timelines = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        try:
+            for line in process.stdout:  # pygame prints a greeting first
+                if line.startswith('{'):
+                    launches.append((time.perf_counter() - start) * 1000)
+                    timelines.append(json.loads(line))
+                    break
+        finally:
+            process.stdout.close()
+            process.wait()
+        if process.returncode:
+            raise RuntimeError(f"{' '.join(command)} exited with status {process.returncode}")
+
+    return {
+        'runs': runs,
+        'median_ms': statistics.median(launches),
+        'max_ms': max(launches),
+        'steps': timelines[launches.index(statistics.median_low(launches))]['steps'],
+    }
+
+
+def compare(results, baseline, tolerance):
+    """| Return the names of scenarios whose p95 frame time is worse than the baseline by more than tolerance |"""
+    regressions = []
+    for name, stats in results.items():
+        old = baseline.get('scenarios', {}).get(name)
+        if old and stats['p95_ms'] > old['p95_ms'] * (1 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    """| Parse arguments, run the scenarios and write the results file |"""
+    parser = argparse.ArgumentParser(description="Headless benchmarks for An Adventure.")
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help=f"scenarios to run (default: all of {', '.join(sorted(SCENARIOS))})")
+    parser.add_argument('-f', '--frames', type=int, default=1000, help="frames per scenario")
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help="results file (JSON)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the traced run that measures peak memory")
+    parser.add_argument('--baseline', help="earlier results file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed p95 slowdown versus the baseline (default: 0.2 = 20%%)")
+    parser.add_argument('--startup-budget', type=float, default=STARTUP_BUDGET_MS,
+                        help=f"longest allowed median time to first frame in ms (default: {STARTUP_BUDGET_MS})")
+    parser.add_argument('--no-startup', action='store_true', help="skip the cold-start measurement")
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    # Run from the project directory so image paths resolve
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    results = {}
+    for name in args.scenarios or sorted(SCENARIOS):
+        stats = run_scenario(name, args.frames, measure_memory=not args.no_memory)
+        results[name] = stats
+        print(f"{name:>14}: {stats['fps']:9.1f} fps  p50 {stats['p50_ms']:7.3f} ms  "
+              f"p95 {stats['p95_ms']:7.3f} ms  p99 {stats['p99_ms']:7.3f} ms")
+
+    startup = None
+    if not args.no_startup:
+        startup = measure_startup()
+        print(f"{'startup':>14}: median {startup['median_ms']:7.1f} ms to first frame "
+              f"(max {startup['max_ms']:.1f} ms, budget {args.startup_budget:.0f} ms)")
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+        'scenarios': results,
+        'startup': startup,
+    }
+    with open(args.output, 'w') as results_file:
+        json.dump(report, results_file, indent=2)
+    print(f"Results written to {args.output}")
+
+    status = 0
+    if startup and startup['median_ms'] > args.startup_budget:
+        print(f"Startup over budget: {startup['median_ms']:.1f} ms > {args.startup_budget:.0f} ms")
+        status = 1
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        if regressions:
+            print(f"Regressions against {args.baseline}: {', '.join(regressions)}")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,13 @@
+import threading
+
 import pygame
-import random
+
+from card_atlas import load_card_atlas
+from blackjack_rules import BlackjackTable, WINS_GOAL
+from cards import CARD_VALUES
+from scenes import Scene
+from text_cache import text_cache
+from event_wait import wait_for_event
 
 # Constants for screen dimensions and colors
 WIDTH, HEIGHT = 900, 650
@@ -7,172 +15,155 @@ WHITE = (220, 220, 220)
 BLACK = (0, 0, 0)
 GREEN = (0, 100, 20)
 SILVER = (135, 135, 135)
+RED = (255, 0, 0)
 CARD_WIDTH, CARD_HEIGHT = 80, 120
-
-# Card suits and ranks for the deck
-SUITS = ['♥', '♦', '♠', '♣']
-RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-
-
-class BlackjackGame:
-
-    def __init__(self):
-        """Initialize the game, Pygame, and its state."""
-        # Game state variables
-        self.dealer_hand = None  # Dealer's hand of cards
-        self.player_hand = None  # Player's hand of cards
-        self.deck = None  # Deck of cards
-        self.player_turn = True  # Indicates if it is the player's turn
-        self.game_over = False  # Tracks if the game is over
-        self.winner_text = ""  # Text displaying the game result
-        self.shuffle_message = ""  # Message about card shuffling
-        self.shuffle_count = 0  # Track number of shuffles
-        self.previous_shuffles = []  # Stores the top 3 cards of previous shuffles
-        self.wins = 0
-        self.losses = 0
-
-        # Initialize Pygame and game UI
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))  # Set screen size
-        pygame.display.set_caption("Blackjack")  # Window title
-        self.font = pygame.font.SysFont('Arial', 36)  # Text font
+CARD_COLORS = (WHITE, BLACK, RED, BLACK)  # Face, border, hearts and diamonds, spades and clubs
+FONT_NAME, FONT_SIZE = 'Arial', 36
+
+
+class BlackjackGame(Scene):
+
+    caption = "Blackjack"
+    size = (WIDTH, HEIGHT)
+    event_driven = True  # The table only changes when the player acts
+
+    def __init__(self, screen=None, decks=1, penetration=0.75, table=None):
+        """
+        Initialize the game, Pygame, and its state.
+        :param screen: Surface of a running game to share; when None, a Blackjack window is opened.
+        :param decks: Decks in the shoe (1 to 8).
+        :param penetration: Fraction of the shoe dealt before it is reshuffled.
+        :param table: Table to play at, e.g. a blackjack_server.RemoteTable; by default a local BlackjackTable.
+        """
+        super().__init__()
+
+        # The rules and cards live in the table; this class only shows its state and sends the player's actions
+        self.table = table if table is not None else BlackjackTable(decks, penetration)
+        self.state = self.table.state()  # What the player can see, see BlackjackTable.state
+        self.decks = decks
+        self.show_prompt = False  # Tracks if the "4 wins" prompt is on screen
+        self.draw_shuffles = False  # Flag to show previous shuffles
+
+        # Button areas for game actions
+        self.more_button_rect = pygame.Rect(450, 580, 100, 50)
+        self.stop_button_rect = pygame.Rect(600, 580, 100, 50)
+        self.replay_button_rect = pygame.Rect(750, 580, 100, 50)
+        self.shuffle_button_rect = pygame.Rect(300, 580, 100, 50)
+        self.draw_shuffles_button_rect = pygame.Rect(40, 580, 200, 50)
+
+        # Initialize Pygame and game UI (only when running in our own window)
+        if screen is None:
+            pygame.init()
+            screen = pygame.display.set_mode((WIDTH, HEIGHT))  # Set screen size
+            pygame.display.set_caption(self.caption)  # Window title
+        self.screen = screen
         self.clock = pygame.time.Clock()  # Frame rate controller
 
-        # Prepare card images for rendering
-        self.card_images = {}
-        for suit in SUITS:
-            for rank in RANKS:
-                # Create a blank surface for each card
-                self.card_images[f'{rank}{suit}'] = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
-                self.card_images[f'{rank}{suit}'].fill(WHITE)
-                pygame.draw.rect(self.card_images[f'{rank}{suit}'], BLACK, self.card_images[f'{rank}{suit}'].get_rect(),
-                                 2)  # Draw card border
-
-                # Render and position rank and suit text on the card
-                text_top_left = self.font.render(rank, 1, f"{'RED' if suit in '♥♦' else 'BLACK'}")
-                self.card_images[f'{rank}{suit}'].blit(text_top_left, (10, 10))
-
-                text_center = self.font.render(suit, True, f"{'RED' if suit in '♥♦' else 'BLACK'}")
-                self.card_images[f'{rank}{suit}'].blit(text_center, (
-                    (CARD_WIDTH - text_center.get_width()) // 2, (CARD_HEIGHT - text_center.get_height()) // 2))
-
-                text_bottom_right = self.font.render(rank, True, f"{'RED' if suit in '♥♦' else 'BLACK'}")
-                self.card_images[f'{rank}{suit}'].blit(text_bottom_right, (
-                    CARD_WIDTH - text_bottom_right.get_width() - 10, CARD_HEIGHT - text_bottom_right.get_height() - 10))
-
-        # Initialize the game state
-        self.reset_game()
-
-    def reset_game(self):
-        """Reset the game state and shuffle the deck."""
-        # Create a fresh deck by combining suits and ranks
-        self.deck = [f'{rank}{suit}' for suit in SUITS for rank in RANKS]
-        random.shuffle(self.deck)  # Shuffle the deck
-
-        # Deal initial hands: 2 cards each for the player and the dealer
-        self.player_hand = [self.deck.pop(), self.deck.pop()]
-        self.dealer_hand = [self.deck.pop(), self.deck.pop()]
-
-        # Reset game state variables
-        self.player_turn = True
-        self.game_over = False
-        self.winner_text = ""
-        self.shuffle_message = ""
-        self.shuffle_count = 0
-        self.previous_shuffles = []
-
-    def shuffle_deck(self):
-        """Shuffle the deck with a limit of 3 times."""
-        if self.shuffle_count < 3:  # Check the shuffle limit
-            # Save the top 3 cards of the deck before shuffling
-            self.previous_shuffles.append(self.deck[:3])
-            random.shuffle(self.deck)  # Shuffle the deck
-            self.shuffle_count += 1
-            self.shuffle_message = f"Deck has been shuffled {self.shuffle_count}/3 times!"
-        else:
-            self.shuffle_message = "3 times shuffle limit!"  # Limit reached
+        self._card_atlas = None  # Sprite sheet of card faces, loaded on first draw
+        self.show_hint = False  # Toggled with H: show the best play during the player's turn
+        self._strategy = None  # Hit/stand table, loaded (or solved) in the background when first asked for
+        self._strategy_thread = None
+        self._strategy_error = None  # Why the strategy table could not be loaded, if it failed
+
+    def act(self, action):
+        """Take an action at the table ('hit', 'stand', 'shuffle', 'new_round' or 'continue') and refresh the view."""
+        self.table.apply(action)
+        self.state = self.table.state()
+
+    @property
+    def player_turn(self):
+        """True while the player may hit, stand or shuffle."""
+        return self.state['player_turn']
+
+    @property
+    def game_over(self):
+        """True once the round has been decided."""
+        return self.state['game_over']
+
+    @property
+    def wins(self):
+        return self.state['wins']
+
+    @property
+    def losses(self):
+        return self.state['losses']
+
+    def finish(self):
+        """Leave the table, closing it if it is remote."""
+        if hasattr(self.table, 'close'):
+            self.table.close()
+        super().finish()
+
+    @property
+    def card_atlas(self):
+        """The sprite sheet of card faces, built or loaded from the disk cache on first use."""
+        if self._card_atlas is None:
+            self._card_atlas = load_card_atlas(FONT_NAME, FONT_SIZE, (CARD_WIDTH, CARD_HEIGHT), CARD_COLORS)
+        return self._card_atlas
+
+    def toggle_hint(self):
+        """Show or hide the hint; the first time, load the strategy table without blocking the table."""
+        self.show_hint = not self.show_hint
+        if self.show_hint and self._strategy_thread is None:
+            self._strategy_thread = threading.Thread(target=self._load_strategy, daemon=True)
+            self._strategy_thread.start()
+            self.idle_timeout = 100  # Wake up regularly until the hint can be shown
+
+    def _load_strategy(self):
+        """
+        Load the strategy table from the disk cache, solving it if this is the first time (a few seconds).
+        Runs on a background thread, so a failure is recorded for the hint to show instead of being raised.
+        """
+        try:
+            from blackjack_strategy import load_strategy
+
+            self._strategy = load_strategy(self.decks)
+        except Exception as e:
+            print(f"Could not load the Blackjack strategy: {e}")
+            self._strategy_error = str(e) or type(e).__name__
+
+    def hint_text(self):
+        """Return the hint for the current hand, e.g. 'Hint: Hit (hit -0.12, stand -0.30)'."""
+        if self._strategy_error is not None:
+            return "Hint: unavailable"
+        if self._strategy is None:
+            return "Hint: working out the odds..."
+        state = self.state
+        upcard = CARD_VALUES[state['dealer'][1]]
+        action, stand, hit = self._strategy.lookup(state['player_value'], state['player_soft'], upcard)
+        return f"Hint: {action.title()} (hit {hit:+.2f}, stand {stand:+.2f})"
+
+    def render_text(self, text, color):
+        """Return the (cached) surface for a line of text in the table font."""
+        return text_cache.render(text, FONT_SIZE, color, name=FONT_NAME, sysfont=True)
 
     def show_continue_or_exit_prompt(self):
         """Display a prompt to either continue playing or quit after 4 wins."""
-        prompt_running = True
-        while prompt_running:
-            self.screen.fill(GREEN)  # Clear the screen
-            prompt_text = self.font.render("4 Wins! Continue (C) or Quit (Q)?", True, WHITE)
-            self.screen.blit(prompt_text, ((WIDTH - prompt_text.get_width()) // 2, HEIGHT // 2 - 50))
-
-            pygame.display.flip()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_q or event.key == pygame.K_ESCAPE:  # Quit the game
-                        pygame.quit()
-                        exit()
-                    elif event.key == pygame.K_c:  # Continue playing
-                        prompt_running = False
-                        self.reset_game()  # Start a new game
-
-    def calculate_hand_value(self, hand):
-        """Calculate the Blackjack value of a given hand."""
-        value = 0
-        aces = 0  # Track number of Aces
-
-        # Calculate the value of each card in the hand
-        for card in hand:
-            card_rank = card[:-1]  # Extract the rank (remove suit)
-            if card_rank in 'JQK':  # Face cards are worth 10 points
-                value += 10
-            elif card_rank == 'A':  # Ace can be worth 1 or 11
-                aces += 1
-                value += 11
-            else:
-                value += int(card_rank)  # Numeric cards
-
-        # Adjust Ace values to prevent bust if necessary
-        while value > 21 and aces:
-            value -= 10
-            aces -= 1
-
-        return value
-
-    def check_winner(self):
-        """Determine the winner based on hand values."""
-        player_value = self.calculate_hand_value(self.player_hand)
-        dealer_value = self.calculate_hand_value(self.dealer_hand)
-
-        # Determine the outcome of the game
-        if player_value > 21:
-            self.winner_text = "Player busts! Dealer wins!"
-            self.losses += 1
-            self.player_turn = False
-        elif dealer_value > 21:
-            self.winner_text = "Dealer busts! Player wins!"
-            self.wins += 1
-        elif player_value > dealer_value:
-            self.winner_text = "Player wins!"
-            self.wins += 1
-        elif player_value < dealer_value:
-            self.winner_text = "Dealer wins!"
-            self.losses += 1
-        else:
-            self.winner_text = "It's a tie!"
-        self.game_over = True
-
-    def draw_hand(self, hand, x, y, hide_first_card=False):
-        """Draw a hand of cards on the screen."""
-        for i, card in enumerate(hand):
-            # Hide the first card (dealer's hidden card during player's turn)
-            if hide_first_card and i == 0:
+        self.screen.fill(GREEN)  # Clear the screen
+        prompt_text = self.render_text("4 Wins! Continue (C) or Quit (Q)?", WHITE)
+        self.screen.blit(prompt_text, ((WIDTH - prompt_text.get_width()) // 2, HEIGHT // 2 - 50))
+
+    def _check_prompt_keydown(self, event):
+        """Respond to a key press while the continue-or-quit prompt is shown."""
+        if event.key == pygame.K_q or event.key == pygame.K_ESCAPE:  # Quit the game
+            self.finish()
+        elif event.key == pygame.K_c:  # Continue playing
+            self.show_prompt = False
+            self.act('continue')  # Reset wins to prevent repeating the prompt and start a new game
+
+    def draw_hand(self, cards, x, y):
+        """Draw a hand of cards on the screen; a card that is None is drawn face down."""
+        for i, card in enumerate(cards):
+            # The dealer's first card is hidden during the player's turn
+            if card is None:
                 pygame.draw.rect(self.screen, BLACK, (x + i * (CARD_WIDTH + 10), y, CARD_WIDTH, CARD_HEIGHT))
             else:
-                self.screen.blit(self.card_images[card], (x + i * (CARD_WIDTH + 10), y))
+                self.card_atlas.draw(self.screen, card, (x + i * (CARD_WIDTH + 10), y))
 
     def draw_button(self, text, x, y, width, height):
         """Draw a button with text and apply a hover effect."""
         # Get the current mouse position
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.mouse_pos
 
         # Check if the mouse is hovering over the button
         if x <= mouse_pos[0] <= x + width and y <= mouse_pos[1] <= y + height:
@@ -187,7 +178,7 @@ class BlackjackGame:
         pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)  # Button border
 
         # Draw the button text
-        button_text = self.font.render(text, True, BLACK)  # Button label
+        button_text = self.render_text(text, BLACK)  # Button label
         self.screen.blit(button_text,
                          (x + (width - button_text.get_width()) // 2, y + (height - button_text.get_height()) // 2))
 
@@ -196,103 +187,144 @@ class BlackjackGame:
         x_offset = WIDTH - (3 * (CARD_WIDTH + 10)) - 50  # Align shuffles to the right
         y_offset = 20
 
-        for i, shuffle in enumerate(self.previous_shuffles):
+        for i, shuffle in enumerate(self.state['previous_shuffles']):
             # Display shuffle number
-            shuffle_text = self.font.render(f'Shuffle {i + 1}:', True, SILVER)
+            shuffle_text = self.render_text(f'Shuffle {i + 1}:', SILVER)
             self.screen.blit(shuffle_text, (x_offset, y_offset))
 
             # Display the top 3 cards from the shuffle
             for j, card in enumerate(shuffle):
-                self.screen.blit(self.card_images[card], (x_offset + j * (CARD_WIDTH + 10), y_offset + 40))
+                self.card_atlas.draw(self.screen, card, (x_offset + j * (CARD_WIDTH + 10), y_offset + 40))
             y_offset += CARD_HEIGHT + 60
 
+    def handle_event(self, event):
+        """Respond to a single mouse or keyboard event."""
+        if self.show_prompt:
+            if event.type == pygame.KEYDOWN:
+                self._check_prompt_keydown(event)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish()  # Leave the table
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+            self.toggle_hint()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.player_turn:  # Handle button clicks during the player's turn
+                if self.more_button_rect.collidepoint(event.pos):  # "More" button clicked
+                    self.act('hit')  # Player draws another card; the round ends on a bust
+                elif self.stop_button_rect.collidepoint(event.pos):  # "Stop" button clicked
+                    self.act('stand')  # Dealer draws until their value is at least 17, then the winner is decided
+                elif self.shuffle_button_rect.collidepoint(event.pos):  # "Shuffle" button clicked
+                    self.act('shuffle')
+            elif self.game_over:  # Handle button clicks after the game ends
+                if self.replay_button_rect.collidepoint(event.pos):  # "Replay" button clicked
+                    self.act('new_round')  # Start a new game
+                    self.draw_shuffles = False
+                elif self.draw_shuffles_button_rect.collidepoint(event.pos):  # "Draw Shuffles" button clicked
+                    self.draw_shuffles = True  # Display previous shuffle results
+
+    def update(self):
+        """Advance the game state by one frame."""
+        # Trigger a prompt after 4 wins
+        if self.wins == WINS_GOAL:
+            self.show_prompt = True
+
+        # Stop waking up once the strategy table has loaded (or failed to)
+        if self._strategy is not None or self._strategy_error is not None:
+            self.idle_timeout = type(self).idle_timeout
+
+    def draw(self, surface):
+        """Render the table onto the given surface."""
+        self.screen = surface
+
+        if self.show_prompt:
+            self.show_continue_or_exit_prompt()
+            return
+
+        # Clear the screen with a green background
+        self.screen.fill(GREEN)
+        # Draw player's and dealer's cards
+        state = self.state
+        self.draw_hand(state['player'], 50, 400)
+        self.draw_hand(state['dealer'], 50, 50)
+
+        # Display player and dealer scores (the dealer's is unknown during the player's turn)
+        dealer_value = state['dealer_value']
+        player_text = self.render_text(f'Player score: {state["player_value"]}', SILVER)
+        dealer_text = self.render_text(f'Dealer score: {dealer_value if dealer_value is not None else "??"}', SILVER)
+        self.screen.blit(player_text, (50, 350))
+        self.screen.blit(dealer_text, (50, 5))
+
+        # Expected values of hitting and standing for this hand (press H)
+        if self.show_hint and self.player_turn:
+            hint_text = self.render_text(self.hint_text(), WHITE)
+            self.screen.blit(hint_text, (350, 350))
+
+        # Draw buttons for game actions
+        self.draw_button("More", 450, 580, 100, 50)
+        self.draw_button("Stop", 600, 580, 100, 50)
+        self.draw_button("Shuffle", 300, 580, 100, 50)
+        if self.game_over:
+            self.draw_button("Replay", 750, 580, 100, 50)
+            self.draw_button("Draw Shuffles", 40, 580, 200, 50)
+            # Display the winner message
+            winner_text_render = self.render_text(state['winner_text'], BLACK)
+            self.screen.blit(winner_text_render, (50, HEIGHT // 2 - 130))
+            # Optionally draw previous shuffles
+            if self.draw_shuffles:
+                self.draw_previous_shuffles()
+
+        # Display shuffle messages
+        if state['shuffle_message']:
+            shuffle_message_render = self.render_text(state['shuffle_message'], SILVER)
+            self.screen.blit(shuffle_message_render, (50, HEIGHT // 2 - 60))
+
+        # Display win and loss counts
+        win_text = self.render_text(f'Wins: {self.wins}', SILVER)
+        loss_text = self.render_text(f'Losses: {self.losses}', SILVER)
+        self.screen.blit(win_text, (WIDTH - 470, 10))
+        self.screen.blit(loss_text, (WIDTH - 470, 50))
+
     def main(self):
-        """Main game loop to handle events and render the game."""
-        running = True
-        draw_shuffles = False  # Flag to show previous shuffles
-        more_button_rect = pygame.Rect(450, 580, 100, 50)
-        stop_button_rect = pygame.Rect(600, 580, 100, 50)
-        replay_button_rect = pygame.Rect(750, 580, 100, 50)
-        shuffle_button_rect = pygame.Rect(300, 580, 100, 50)
-        draw_shuffles_button_rect = pygame.Rect(40, 580, 200, 50)
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False  # Exit the game when the window is closed
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.player_turn:  # Handle button clicks during the player's turn
-                        if more_button_rect.collidepoint(event.pos):  # "More" button clicked
-                            self.player_hand.append(self.deck.pop())  # Player draws another card
-                            if self.calculate_hand_value(self.player_hand) > 21:
-                                self.check_winner()  # Check for player bust
-                        elif stop_button_rect.collidepoint(event.pos):  # "Stop" button clicked
-                            self.player_turn = False
-                            # Dealer draws cards until their value is at least 17
-                            while self.calculate_hand_value(self.dealer_hand) < 17:
-                                self.dealer_hand.append(self.deck.pop())
-                            self.check_winner()  # Determine the winner after the dealer's turn
-                        elif shuffle_button_rect.collidepoint(event.pos):  # "Shuffle" button clicked
-                            self.shuffle_deck()
-                    elif self.game_over:  # Handle button clicks after the game ends
-                        if replay_button_rect.collidepoint(event.pos):  # "Replay" button clicked
-                            self.reset_game()  # Start a new game
-                            draw_shuffles = False
-                        elif draw_shuffles_button_rect.collidepoint(event.pos):  # "Draw Shuffles" button clicked
-                            draw_shuffles = True  # Display previous shuffle results
-
-            # Trigger a prompt after 4 wins
-            if self.wins == 4:
-                self.show_continue_or_exit_prompt()
-                self.wins = 0  # Reset wins to prevent repeating the prompt
-
-            # Clear the screen with a green background
-            self.screen.fill(GREEN)
-            # Draw player's and dealer's cards
-            self.draw_hand(self.player_hand, 50, 400)
-            self.draw_hand(self.dealer_hand, 50, 50, hide_first_card=self.player_turn)
-
-            # Display player and dealer scores
-            player_value = self.calculate_hand_value(self.player_hand)
-            dealer_value = self.calculate_hand_value(self.dealer_hand)
-            player_text = self.font.render(f'Player score: {player_value}', True, SILVER)
-            dealer_text = self.font.render(f'Dealer score: {dealer_value if not self.player_turn else "??"}', True,
-                                           SILVER)
-            self.screen.blit(player_text, (50, 350))
-            self.screen.blit(dealer_text, (50, 5))
-
-            # Draw buttons for game actions
-            self.draw_button("More", 450, 580, 100, 50)
-            self.draw_button("Stop", 600, 580, 100, 50)
-            self.draw_button("Shuffle", 300, 580, 100, 50)
-            if self.game_over:
-                self.draw_button("Replay", 750, 580, 100, 50)
-                self.draw_button("Draw Shuffles", 40, 580, 200, 50)
-                # Display the winner message
-                winner_text_render = self.font.render(self.winner_text, True, BLACK)
-                self.screen.blit(winner_text_render, (50, HEIGHT // 2 - 130))
-                # Optionally draw previous shuffles
-                if draw_shuffles:
-                    self.draw_previous_shuffles()
-
-            # Display shuffle messages
-            if self.shuffle_message:
-                shuffle_message_render = self.font.render(self.shuffle_message, True, SILVER)
-                self.screen.blit(shuffle_message_render, (50, HEIGHT // 2 - 60))
-
-            # Display win and loss counts
-            win_text = self.font.render(f'Wins: {self.wins}', True, SILVER)
-            loss_text = self.font.render(f'Losses: {self.losses}', True, SILVER)
-            self.screen.blit(win_text, (WIDTH - 470, 10))
-            self.screen.blit(loss_text, (WIDTH - 470, 50))
+        """Main game loop when Blackjack runs in its own window."""
+        window = self.screen
+
+        while not self.finished:
+            self.mouse_pos = pygame.mouse.get_pos()
+            self.update()
+            self.draw(window)
 
             # Update the display and limit the frame rate
             pygame.display.flip()
             self.clock.tick(30)
 
+            # Sleep until the player does something (or the idle timeout), then handle everything that arrived
+            first_event = wait_for_event(self.idle_timeout)
+            for event in ([first_event] if first_event is not None else []) + pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.finish()  # Exit the game when the window is closed
+                else:
+                    self.handle_event(event)
+
         pygame.quit()  # Quit Pygame when the game loop ends
 
 
-if __name__ == "__main__":
-    game = BlackjackGame()
+def main(argv=None):
+    """Play Blackjack in its own window, at a local table or at one hosted by blackjack_server.py."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play Blackjack.")
+    parser.add_argument('--decks', type=int, default=1, help="decks in the shoe (1 to 8)")
+    parser.add_argument('--connect', metavar='HOST:PORT', help="play at a table on a Blackjack server")
+    args = parser.parse_args(argv)
+
+    table = None
+    if args.connect:
+        from blackjack_server import RemoteTable
+
+        host, _, port = args.connect.rpartition(':')
+        table = RemoteTable(host or '127.0.0.1', int(port), decks=args.decks)
+    game = BlackjackGame(decks=args.decks, table=table)
     game.main()
+
+
+if __name__ == "__main__":
+    main()
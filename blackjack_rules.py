@@ -0,0 +1,154 @@
+from cards import Hand, Shoe
+
+DEALER_STANDS_ON = 17  # The dealer draws below this total (and stands on soft 17)
+SHUFFLE_LIMIT = 3  # Reshuffles of the shoe the player may ask for each round
+WINS_GOAL = 4  # Wins after which the player is asked to continue or quit
+
+# Actions a player can take at a table, by name (the names the server protocol uses)
+ACTIONS = ('hit', 'stand', 'shuffle', 'new_round', 'continue')
+
+
+class BlackjackTable:
+    """| The rules and state of one Blackjack table, with no drawing: the pygame UI, the server and bots all play through it |"""
+
+    def __init__(self, decks=1, penetration=0.75, seed=None):
+        """
+        Initialize the table and deal the first round.
+        :param decks: Decks in the shoe (1 to 8).
+        :param penetration: Fraction of the shoe dealt before it is reshuffled.
+        :param seed: Seed for a reproducible shoe, or None.
+        """
+        self.shoe = Shoe(decks, penetration, seed)  # Cards are integers, see cards.py
+        self.player_hand = None  # Player's Hand of cards
+        self.dealer_hand = None  # Dealer's Hand of cards; the first card is face down during the player's turn
+        self.player_turn = True  # Indicates if it is the player's turn
+        self.game_over = False  # Tracks if the round is over
+        self.result = None  # 'win', 'loss' or 'push' once the round is over
+        self.winner_text = ""  # Text describing the result
+        self.shuffle_message = ""  # Message about card shuffling
+        self.shuffle_count = 0  # Reshuffles asked for this round
+        self.previous_shuffles = []  # The top 3 cards of the shoe before each reshuffle
+        self.wins = 0
+        self.losses = 0
+        self.hands_played = 0  # Rounds finished at this table
+        self.new_round()
+
+    def new_round(self):
+        """| Deal a new round, shuffling the shoe first once the cut card is out |"""
+        reshuffled = self.shoe.start_round()
+
+        # Deal initial hands: 2 cards each for the player and the dealer
+        deal = self.shoe.deal
+        self.player_hand = Hand([deal(), deal()])
+        self.dealer_hand = Hand([deal(), deal()])
+
+        self.player_turn = True
+        self.game_over = False
+        self.result = None
+        self.winner_text = ""
+        self.shuffle_message = "Cut card reached: the shoe was reshuffled." if reshuffled else ""
+        self.shuffle_count = 0
+        self.previous_shuffles = []
+
+    def _require_player_turn(self, action):
+        if not self.player_turn:
+            raise ValueError(f"cannot {action}: it is not the player's turn")
+
+    def hit(self):
+        """| Deal the player another card; the round ends at once on a bust |"""
+        self._require_player_turn('hit')
+        self.player_hand.add(self.shoe.deal())
+        if self.player_hand.is_bust:
+            self._finish_round()
+
+    def stand(self):
+        """| End the player's turn: the dealer draws to 17 and the round is decided |"""
+        self._require_player_turn('stand')
+        self.player_turn = False
+        while self.dealer_hand.value < DEALER_STANDS_ON:
+            self.dealer_hand.add(self.shoe.deal())
+        self._finish_round()
+
+    def shuffle(self):
+        """| Reshuffle the undealt cards, at most SHUFFLE_LIMIT times a round |"""
+        self._require_player_turn('shuffle')
+        if self.shuffle_count < SHUFFLE_LIMIT:
+            self.previous_shuffles.append(self.shoe.peek(3))
+            self.shoe.shuffle_remaining()
+            self.shuffle_count += 1
+            self.shuffle_message = f"Deck has been shuffled {self.shuffle_count}/{SHUFFLE_LIMIT} times!"
+        else:
+            self.shuffle_message = f"{SHUFFLE_LIMIT} times shuffle limit!"
+
+    def continue_playing(self):
+        """| Start counting towards WINS_GOAL again and deal a new round; only allowed once the goal is reached |"""
+        if self.wins < WINS_GOAL:
+            raise ValueError(f"cannot continue: the player has {self.wins} of {WINS_GOAL} wins")
+        self.wins = 0
+        self.new_round()
+
+    def _finish_round(self):
+        """| Decide the round from the hand values and update the score |"""
+        player_value = self.player_hand.value
+        dealer_value = self.dealer_hand.value
+
+        if player_value > 21:
+            self.result, self.winner_text = 'loss', "Player busts! Dealer wins!"
+        elif dealer_value > 21:
+            self.result, self.winner_text = 'win', "Dealer busts! Player wins!"
+        elif player_value > dealer_value:
+            self.result, self.winner_text = 'win', "Player wins!"
+        elif player_value < dealer_value:
+            self.result, self.winner_text = 'loss', "Dealer wins!"
+        else:
+            self.result, self.winner_text = 'push', "It's a tie!"
+
+        if self.result == 'win':
+            self.wins += 1
+        elif self.result == 'loss':
+            self.losses += 1
+        self.player_turn = False
+        self.game_over = True
+        self.hands_played += 1
+
+    def apply(self, action):
+        """| Take an action by name (see ACTIONS); raise ValueError for unknown or illegal ones |"""
+        if action == 'hit':
+            self.hit()
+        elif action == 'stand':
+            self.stand()
+        elif action == 'shuffle':
+            self.shuffle()
+        elif action == 'new_round':
+            if not self.game_over:
+                raise ValueError("cannot deal a new round before this one is over")
+            self.new_round()
+        elif action == 'continue':
+            self.continue_playing()
+        else:
+            raise ValueError(f"Unknown action {action!r}; choose from {', '.join(ACTIONS)}")
+
+    def state(self):
+        """
+        Return what a player at the table can see, as plain JSON-friendly values.
+        The dealer's face-down card is None, and their total None, during the player's turn.
+        """
+        dealer = list(self.dealer_hand)
+        if self.player_turn:
+            dealer[0] = None
+        return {
+            'player': list(self.player_hand),
+            'player_value': self.player_hand.value,
+            'player_soft': self.player_hand.is_soft,
+            'dealer': dealer,
+            'dealer_value': None if self.player_turn else self.dealer_hand.value,
+            'player_turn': self.player_turn,
+            'game_over': self.game_over,
+            'result': self.result,
+            'winner_text': self.winner_text,
+            'shuffle_message': self.shuffle_message,
+            'shuffle_count': self.shuffle_count,
+            'previous_shuffles': self.previous_shuffles,
+            'wins': self.wins,
+            'losses': self.losses,
+        }
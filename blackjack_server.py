@@ -0,0 +1,280 @@
+"""
+A headless Blackjack server: one process hosts thousands of tables, scheduled with asyncio, for bots
+and load tests. Clients speak JSON lines over a local TCP socket; one connection can open any number
+of tables, and requests may be pipelined (responses come back in the order the requests were sent).
+
+    {"action": "open", "decks": 6, "penetration": 0.75, "seed": 1}  -> {"ok": true, "table": 1, "state": {...}}
+    {"table": 1, "action": "hit"}       (also stand, shuffle, new_round, continue, state, close)
+    -> {"ok": true, "table": 1, "state": {...}}  or  {"ok": false, "error": "..."}
+
+The state is BlackjackTable.state(). Tables are closed when their connection closes.
+
+    python blackjack_server.py serve                          # listen on 127.0.0.1:8765
+    python blackjack_server.py bench --tables 2000 --hands 200000
+    python blackjack_server.py bench --host 127.0.0.1         # load-test a server that is already running
+    python blackjack.py --connect 127.0.0.1:8765              # play at the server with the pygame UI
+"""
+import asyncio
+import collections
+import itertools
+import json
+import socket
+import time
+
+from blackjack_rules import BlackjackTable, DEALER_STANDS_ON
+
+HOST, PORT = '127.0.0.1', 8765
+MAX_TABLES_PER_CONNECTION = 100_000
+MAX_LINE = 2 ** 16  # Longest request accepted (bytes); a connection sending longer lines is closed
+READ_SIZE = 2 ** 16
+
+
+class BlackjackServer:
+    """| Tables and the connections that own them |"""
+
+    def __init__(self):
+        """| Initialize a server with no tables |"""
+        self.tables = {}  # Table id -> BlackjackTable
+        self._next_id = itertools.count(1)
+        self.requests = 0  # Requests handled, for the benchmark
+
+    def handle(self, request, owned):
+        """
+        Answer one request and return the response.
+        :param owned: Set of table ids opened on the requesting connection; only those may be used.
+        """
+        action = request.get('action')
+        if action == 'open':
+            if len(owned) >= MAX_TABLES_PER_CONNECTION:
+                raise ValueError(f"at most {MAX_TABLES_PER_CONNECTION} tables per connection")
+            table_id = next(self._next_id)
+            self.tables[table_id] = BlackjackTable(request.get('decks', 1), request.get('penetration', 0.75),
+                                                   request.get('seed'))
+            owned.add(table_id)
+        else:
+            table_id = request.get('table')
+            if table_id not in owned:
+                raise ValueError(f"no table {table_id!r} on this connection")
+            if action == 'close':
+                owned.discard(table_id)
+                del self.tables[table_id]
+                return {'ok': True, 'table': table_id}
+            if action != 'state':
+                self.tables[table_id].apply(action)
+        return {'ok': True, 'table': table_id, 'state': self.tables[table_id].state()}
+
+    async def serve_connection(self, reader, writer):
+        """
+        Answer the requests of one connection, in order, until it closes.
+        Every complete line that has arrived is answered before waiting again, with one write for the
+        whole batch, so pipelining clients cost one wake-up per read rather than one per request.
+        """
+        owned = set()
+        partial = b''
+        try:
+            while data := await reader.read(READ_SIZE):
+                *lines, partial = (partial + data).split(b'\n')
+                if len(partial) > MAX_LINE:
+                    break
+                responses = []
+                for line in lines:
+                    try:
+                        response = self.handle(json.loads(line), owned)
+                    except (ValueError, TypeError, AttributeError) as e:  # Bad JSON, bad request or illegal action
+                        response = {'ok': False, 'error': str(e)}
+                    responses.append(json.dumps(response).encode())
+                self.requests += len(lines)
+                if responses:
+                    responses.append(b'')
+                    writer.write(b'\n'.join(responses))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for table_id in owned:
+                del self.tables[table_id]
+            writer.close()
+
+    async def start(self, host=HOST, port=PORT):
+        """| Start listening and return the asyncio server (port 0 picks a free port) |"""
+        return await asyncio.start_server(self.serve_connection, host, port)
+
+
+class RemoteTable:
+    """
+    A table hosted by the server, used like a local BlackjackTable through blocking calls:
+    the pygame UI is just one more client. Only the state a player can see is available.
+    """
+
+    def __init__(self, host=HOST, port=PORT, decks=1, penetration=0.75, seed=None, timeout=5):
+        """| Connect and open a table |"""
+        self._socket = socket.create_connection((host, port), timeout)
+        self._file = self._socket.makefile('rwb')
+        self.table_id = None
+        self._state = self._request({'action': 'open', 'decks': decks, 'penetration': penetration, 'seed': seed})
+
+    def _request(self, request):
+        """| Send a request and return the table state from the response |"""
+        self._file.write(json.dumps(request).encode() + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("the Blackjack server closed the connection")
+        response = json.loads(line)
+        if not response['ok']:
+            raise ValueError(response['error'])
+        self.table_id = response['table']
+        return response.get('state')
+
+    def apply(self, action):
+        """| Take an action by name, as BlackjackTable.apply does |"""
+        self._state = self._request({'table': self.table_id, 'action': action})
+
+    def state(self):
+        """| Return the table state from the last response |"""
+        return self._state
+
+    def close(self):
+        """| Close the table and the connection |"""
+        try:
+            self._request({'table': self.table_id, 'action': 'close'})
+        except (OSError, ValueError):
+            pass
+        self._file.close()
+        self._socket.close()
+
+
+class _PipelinedClient:
+    """| One bot connection: many tables share it, with requests pipelined and answered in order |"""
+
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+        self.pending = collections.deque()  # Futures of the requests sent, oldest first
+        self._read_task = asyncio.ensure_future(self._read_responses())
+
+    async def _read_responses(self):
+        """| Resolve the oldest pending request with each response that arrives |"""
+        partial = b''
+        while data := await self.reader.read(READ_SIZE):
+            *lines, partial = (partial + data).split(b'\n')
+            for line in lines:
+                self.pending.popleft().set_result(json.loads(line))
+
+    async def request(self, request):
+        """| Send a request and wait for its response |"""
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(future)
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        response = await future
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._read_task.cancel()
+
+
+async def _bot(client, hands, seed, decks, penetration, counter):
+    """| Play hands at one table: hit below DEALER_STANDS_ON, like the dealer, then deal again |"""
+    response = await client.request({'action': 'open', 'decks': decks, 'penetration': penetration, 'seed': seed})
+    table_id, state = response['table'], response['state']
+    for _ in range(hands):
+        while state['player_turn']:
+            action = 'hit' if state['player_value'] < DEALER_STANDS_ON else 'stand'
+            state = (await client.request({'table': table_id, 'action': action}))['state']
+        counter[state['result']] += 1
+        state = (await client.request({'table': table_id, 'action': 'new_round'}))['state']
+    await client.request({'table': table_id, 'action': 'close'})
+
+
+async def bench(tables=1000, hands=100_000, connections=8, decks=6, penetration=0.75, host=None, port=PORT):
+    """
+    Play `hands` hands spread over `tables` concurrent tables and return the throughput.
+    :param host: Server to load-test; when None, a server is started in this process (and event loop).
+    """
+    server = None
+    if host is None:
+        blackjack_server = BlackjackServer()
+        server = await blackjack_server.start(HOST, 0)
+        host, port = server.sockets[0].getsockname()[:2]
+
+    clients = []
+    for _ in range(min(connections, tables)):
+        reader, writer = await asyncio.open_connection(host, port)
+        clients.append(_PipelinedClient(reader, writer))
+
+    counter = {'win': 0, 'loss': 0, 'push': 0}
+    per_table, extra = divmod(hands, tables)
+    bots = [_bot(clients[i % len(clients)], per_table + (i < extra), i, decks, penetration, counter)
+            for i in range(tables)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*bots)
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        await client.close()
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    played = sum(counter.values())
+    return {
+        'tables': tables,
+        'connections': len(clients),
+        'hands': played,
+        'seconds': elapsed,
+        'hands_per_second': played / elapsed,
+        'win_rate': counter['win'] / played if played else 0.0,
+    }
+
+
+async def _serve_forever(host, port):
+    server = await BlackjackServer().start(host, port)
+    print(f"Blackjack server listening on {', '.join(str(s.getsockname()) for s in server.sockets)}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """| Parse arguments and either serve tables or run the throughput benchmark |"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Headless multi-table Blackjack server.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help="host tables until interrupted")
+    serve_parser.add_argument('--host', default=HOST)
+    serve_parser.add_argument('--port', type=int, default=PORT)
+
+    bench_parser = commands.add_parser('bench', help="play bot hands and report hands per second")
+    bench_parser.add_argument('--tables', type=int, default=1000, help="concurrent tables")
+    bench_parser.add_argument('--hands', type=int, default=100_000, help="hands in total")
+    bench_parser.add_argument('--connections', type=int, default=8, help="client connections the tables share")
+    bench_parser.add_argument('--decks', type=int, default=6, help="decks per shoe")
+    bench_parser.add_argument('--host', help="server to load-test (default: start one in this process)")
+    bench_parser.add_argument('--port', type=int, default=PORT)
+    bench_parser.add_argument('--json', action='store_true', help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(_serve_forever(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    result = asyncio.run(bench(args.tables, args.hands, args.connections, args.decks, host=args.host, port=args.port))
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"{result['hands']:,} hands at {result['tables']:,} tables over {result['connections']} connections "
+              f"in {result['seconds']:.2f} s: {result['hands_per_second']:,.0f} hands/s "
+              f"(bot win rate {result['win_rate']:.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Monte Carlo odds for the Blackjack mini-game, simulated with NumPy a whole batch of hands at a time.
+
+The rules are those of BlackjackTable (blackjack_rules.py) with a single deck shuffled before every
+hand: two cards each, the player hits or stands (and loses at once on a bust), the dealer draws until
+17 or more (standing on soft 17), aces count 11 or 1, and equal totals push:
+
+    python blackjack_sim.py                      # 1,000,000 hands, hit below 17
+    python blackjack_sim.py -n 5000000 --stand-on 15
+    python blackjack_sim.py --check-shuffle      # compare against hands using the 3 shuffles
+"""
+import time
+
+import numpy as np
+
+from blackjack_rules import DEALER_STANDS_ON
+from cards import CARD_VALUES, DECK_SIZE
+
+# Blackjack value of every card of a deck, in card order (the same encoding the game uses)
+DECK_VALUES = np.array(CARD_VALUES, dtype=np.int8)
+INITIAL_CARDS = 4  # Two for the player, two for the dealer
+
+
+class _Shoes:
+    """| One shuffled deck per hand, shuffled lazily: a card position is only randomised when first needed |"""
+
+    def __init__(self, hands, rng):
+        self.rng = rng
+        self.values = np.tile(DECK_VALUES, (hands, 1))
+        self.rows = np.arange(hands)
+        self.shuffled = 0  # Positions 0..shuffled-1 already hold their final random card
+
+    def _shuffle_from(self, start, stop):
+        """| Fisher-Yates over positions start..stop-1, choosing among every card from start to the end |"""
+        values, rows = self.values, self.rows
+        for position in range(start, stop):
+            picks = position + (self.rng.random(len(rows)) * (DECK_SIZE - position)).astype(np.intp)
+            picked = values[rows, picks]
+            values[rows, picks] = values[:, position]
+            values[:, position] = picked
+
+    def card(self, positions):
+        """| Return the value of the card at each hand's position (positions is one index per hand) |"""
+        needed = int(positions.max()) + 1
+        if needed > self.shuffled:
+            self._shuffle_from(self.shuffled, needed)
+            self.shuffled = needed
+        return self.values[self.rows, positions]
+
+    def reshuffle_remaining(self, dealt):
+        """
+        Shuffle every card after the first `dealt` again, as the game's Shuffle button does.
+        The deck is first shuffled in full and then reshuffled in full, rather than relying on the lazy
+        shuffle, so comparing against hands without reshuffles is a real test of the odds.
+        """
+        self._shuffle_from(self.shuffled, DECK_SIZE)
+        self._shuffle_from(dealt, DECK_SIZE)
+        self.shuffled = DECK_SIZE
+
+
+def _add_card(total, soft_aces, value, mask):
+    """| Add a card value to the hands selected by mask, counting an ace as 1 when 11 would bust |"""
+    value = np.where(mask, value, 0)
+    total += value
+    soft_aces += value == 11
+    for _ in range(2):  # A new ace can push an already soft hand over 21 twice
+        demote = (total > 21) & (soft_aces > 0)
+        total -= 10 * demote
+        soft_aces -= demote
+
+
+def threshold_policy(stand_on):
+    """| Return a policy that hits while the hand total is below stand_on |"""
+    return lambda total, soft_aces, dealer_up: total < stand_on
+
+
+def _play_chunk(hands, policy, shuffles, rng):
+    """| Play a batch of hands and return (wins, losses, pushes) |"""
+    shoes = _Shoes(hands, rng)
+    position = np.zeros(hands, dtype=np.intp)  # Next card of each hand's deck
+
+    def deal():
+        return shoes.card(position)
+
+    # Deal in the game's order: player, player, dealer, dealer; the dealer's second card is face up
+    player, player_soft = np.zeros(hands, dtype=np.int16), np.zeros(hands, dtype=np.int16)
+    dealer, dealer_soft = np.zeros(hands, dtype=np.int16), np.zeros(hands, dtype=np.int16)
+    everyone = np.ones(hands, dtype=bool)
+    for total, soft in ((player, player_soft), (player, player_soft), (dealer, dealer_soft), (dealer, dealer_soft)):
+        _add_card(total, soft, deal(), everyone)
+        position += 1
+    dealer_up = shoes.values[:, 3].astype(np.int16)
+
+    for _ in range(shuffles):
+        shoes.reshuffle_remaining(INITIAL_CARDS)
+
+    # Player: hit until the policy stands or the hand busts
+    acting = np.asarray(policy(player, player_soft, dealer_up), dtype=bool) & everyone
+    while acting.any():
+        _add_card(player, player_soft, deal(), acting)
+        position += acting
+        acting &= player <= 21
+        acting &= np.asarray(policy(player, player_soft, dealer_up), dtype=bool)
+    player_bust = player > 21
+
+    # Dealer: only plays against hands that did not bust
+    drawing = ~player_bust & (dealer < DEALER_STANDS_ON)
+    while drawing.any():
+        _add_card(dealer, dealer_soft, deal(), drawing)
+        position += drawing
+        drawing &= dealer < DEALER_STANDS_ON
+
+    standing = ~player_bust
+    wins = standing & ((dealer > 21) | (player > dealer))
+    pushes = standing & (dealer <= 21) & (player == dealer)
+    return int(wins.sum()), hands - int(wins.sum()) - int(pushes.sum()), int(pushes.sum())
+
+
+def simulate(hands, policy=17, shuffles=0, seed=None, chunk_size=250_000):
+    """
+    Play many hands and return the outcome counts and rates.
+    :param policy: Stand-on total (hit below it), or a function (total, soft_aces, dealer_up) -> bool array
+                   of hands that hit; each argument is an array with one entry per hand.
+    :param shuffles: How many times the remaining deck is reshuffled after the deal (the game allows 3).
+    :param chunk_size: Hands simulated at once; bounds memory (about 100 bytes per hand).
+    """
+    if hands < 1:
+        raise ValueError(f"simulate at least 1 hand, not {hands}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+    if not callable(policy):
+        policy = threshold_policy(policy)
+    rng = np.random.default_rng(seed)
+
+    wins = losses = pushes = 0
+    remaining = hands
+    while remaining > 0:
+        chunk = min(chunk_size, remaining)
+        chunk_wins, chunk_losses, chunk_pushes = _play_chunk(chunk, policy, shuffles, rng)
+        wins, losses, pushes = wins + chunk_wins, losses + chunk_losses, pushes + chunk_pushes
+        remaining -= chunk
+
+    return {
+        'hands': hands,
+        'wins': wins,
+        'losses': losses,
+        'pushes': pushes,
+        'win_rate': wins / hands,
+        'loss_rate': losses / hands,
+        'push_rate': pushes / hands,
+    }
+
+
+def expected_hands_to_win(win_rate, wins=4):
+    """| Average number of hands needed to collect `wins` wins (the mini-game's goal) |"""
+    return wins / win_rate if win_rate else float('inf')
+
+
+def main(argv=None):
+    """| Parse arguments, run the simulation and print the odds |"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Monte Carlo odds for the Blackjack mini-game.")
+    parser.add_argument('-n', '--hands', type=int, default=1_000_000, help="hands to simulate")
+    parser.add_argument('--stand-on', type=int, default=17, help="player stands at this total or more")
+    parser.add_argument('--shuffles', type=int, default=0, choices=range(4),
+                        help="reshuffles of the remaining deck after the deal")
+    parser.add_argument('--check-shuffle', action='store_true',
+                        help="also simulate with 3 reshuffles and compare the rates")
+    parser.add_argument('--seed', type=int, help="seed for reproducible results")
+    args = parser.parse_args(argv)
+    if args.hands < 1:
+        parser.error(f"--hands must be at least 1, not {args.hands}")
+
+    runs = [args.shuffles] + ([3] if args.check_shuffle and args.shuffles != 3 else [])
+    results = []
+    for shuffles in runs:
+        start = time.perf_counter()
+        result = simulate(args.hands, args.stand_on, shuffles, args.seed)
+        elapsed = time.perf_counter() - start
+        results.append(result)
+        print(f"stand on {args.stand_on}, {shuffles} shuffles: win {result['win_rate']:.4%}  "
+              f"loss {result['loss_rate']:.4%}  push {result['push_rate']:.4%}  "
+              f"({args.hands / elapsed:,.0f} hands/s; ~{expected_hands_to_win(result['win_rate']):.1f} hands for 4 wins)")
+
+    if len(results) == 2:
+        # Difference against its standard error: within about 3 means the shuffle does not change the odds
+        p1, p2 = results[0]['win_rate'], results[1]['win_rate']
+        error = ((p1 * (1 - p1) + p2 * (1 - p2)) / args.hands) ** 0.5
+        print(f"win rate difference: {p2 - p1:+.4%} ({(p2 - p1) / error:+.1f} standard errors)")
+
+
+if __name__ == "__main__":
+    main()
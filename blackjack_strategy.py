@@ -0,0 +1,253 @@
+"""
+The expected-value-optimal hit/stand decision for every (player total, soft or hard, dealer upcard)
+under the rules of BlackjackTable: the dealer draws below 17 and stands on soft 17, a player bust
+loses at once, equal totals push, and there are no naturals, doubles or splits.
+
+Values are exact for a freshly shuffled shoe: a memoised recursion over the composition of the cards
+left (after the player's cards and the dealer's upcard) gives the EV of standing and of hitting then
+playing on optimally. For each table entry the EVs of every player hand with that total are averaged,
+weighted by how likely the hand is, so the table is the best play for a player who knows only the
+total and the upcard. It is cached on disk as JSON and looked up in O(1):
+
+    python blackjack_strategy.py             # print the single-deck table
+    python blackjack_strategy.py --decks 6
+"""
+import json
+import os
+from functools import partial
+
+from atomic_file import write_atomically
+from blackjack_rules import DEALER_STANDS_ON
+from cards import CARD_VALUES, DECK_SIZE, RANK_VALUES, Hand
+
+CACHE_DIR = os.path.join('cache', 'strategy')
+STRATEGY_VERSION = 2  # Bump when the rules or the solver change, so old tables are recomputed
+
+# Cards are grouped by Blackjack value: 2..9, 10 (tens and faces) and 11 (aces)
+VALUES = tuple(sorted(set(RANK_VALUES)))
+VALUE_COUNTS = tuple(RANK_VALUES.count(value) * DECK_SIZE // len(RANK_VALUES) for value in VALUES)
+ACE_VALUE = 11
+FINAL_TOTALS = tuple(range(DEALER_STANDS_ON, 22))  # The dealer's possible totals when standing
+
+
+def _add(total, soft_aces, value):
+    """| Return (total, soft aces) after adding a card value, counting aces as 1 when 11 would bust |"""
+    total += value
+    if value == ACE_VALUE:
+        soft_aces += 1
+    while total > 21 and soft_aces:  # As in cards.Hand.add: an ace joining soft 21 demotes two aces
+        total -= 10
+        soft_aces -= 1
+    return total, soft_aces
+
+
+def check_totals():
+    """
+    Check that _add agrees with cards.Hand for every reachable (total, soft aces) and every card value;
+    return the number of combinations checked, raising AssertionError on the first disagreement.
+    """
+    cards_by_value = {CARD_VALUES[card]: card for card in range(DECK_SIZE)}
+    hands = {(0, 0): []}  # (total, soft aces) -> cards of one hand that reaches it
+    seen = set(hands)
+    checked = 0
+    while hands:
+        next_hands = {}
+        for (total, soft_aces), cards in hands.items():
+            for value in VALUES:
+                hand = Hand(cards + [cards_by_value[value]])
+                expected = (hand.value, hand.soft_aces)
+                got = _add(total, soft_aces, value)
+                assert got == expected, f"_add({total}, {soft_aces}, {value}) = {got}, but Hand gives {expected}"
+                checked += 1
+                if not hand.is_bust and expected not in seen:
+                    seen.add(expected)
+                    next_hands[expected] = hand.cards
+        hands = next_hands
+    return checked
+
+
+def _remove(composition, index):
+    """| Return the composition with one card of VALUES[index] taken out |"""
+    return composition[:index] + (composition[index] - 1,) + composition[index + 1:]
+
+
+class StrategySolver:
+    """| Memoised EVs for a shoe of the given number of decks |"""
+
+    def __init__(self, decks=1):
+        """| Initialize the solver with empty memo tables |"""
+        self.full_shoe = tuple(count * decks for count in VALUE_COUNTS)  # Cards of each value in VALUES order
+        self._dealer_memo = {}  # (composition, total, soft aces) -> probabilities of FINAL_TOTALS and of a bust
+        self._player_memo = {}  # (composition, total, soft aces, upcard) -> (EV of standing, EV of hitting)
+
+    def dealer_outcomes(self, composition, total, soft_aces):
+        """
+        Return the probability of the dealer ending on each of FINAL_TOTALS, then of busting,
+        for a dealer who must still draw (total below DEALER_STANDS_ON).
+        """
+        key = (composition, total, soft_aces)
+        outcomes = self._dealer_memo.get(key)
+        if outcomes is None:
+            outcomes = [0.0] * (len(FINAL_TOTALS) + 1)
+            cards = sum(composition)
+            for index, count in enumerate(composition):
+                if count:
+                    chance = count / cards
+                    new_total, new_soft = _add(total, soft_aces, VALUES[index])
+                    if new_total >= DEALER_STANDS_ON:  # Most draws end the hand: no need to recurse
+                        outcomes[new_total - DEALER_STANDS_ON if new_total <= 21 else -1] += chance
+                    else:
+                        after = self.dealer_outcomes(_remove(composition, index), new_total, new_soft)
+                        for i, p in enumerate(after):
+                            outcomes[i] += chance * p
+            self._dealer_memo[key] = outcomes
+        return outcomes
+
+    def stand_ev(self, composition, total, upcard):
+        """| EV of standing on total: the dealer turns over the hole card and draws from composition |"""
+        outcomes = self.dealer_outcomes(composition, upcard, int(upcard == ACE_VALUE))
+        ev = outcomes[-1]  # The dealer busts
+        for final, p in zip(FINAL_TOTALS, outcomes):
+            ev += p if total > final else -p if total < final else 0.0
+        return ev
+
+    def evs(self, composition, total, soft_aces, upcard):
+        """| Return (EV of standing, EV of hitting and then playing optimally) for a player hand |"""
+        key = (composition, total, soft_aces, upcard)
+        result = self._player_memo.get(key)
+        if result is None:
+            stand = self.stand_ev(composition, total, upcard)
+            hit = 0.0
+            cards = sum(composition)
+            for index, count in enumerate(composition):
+                if count:
+                    new_total, new_soft = _add(total, soft_aces, VALUES[index])
+                    if new_total > 21:
+                        hit -= count / cards
+                    else:
+                        hit += count / cards * max(self.evs(_remove(composition, index), new_total, new_soft, upcard))
+            result = self._player_memo[key] = (stand, hit)
+        return result
+
+    def table(self):
+        """
+        Return {(total, soft, upcard): (EV of standing, EV of hitting)} for every total a player can
+        decide on (4 to 21), both kinds of hand and every upcard value (2 to 11 for an ace).
+        """
+        sums = {}  # (total, soft, upcard) -> [weight, weighted EV of standing, weighted EV of hitting]
+        for up_index, upcard in enumerate(VALUES):
+            shoe = _remove(self.full_shoe, up_index)
+
+            # Hands of the same cards in any order are one state; weight = chance of being dealt them
+            hands = {}
+            for first, first_count in enumerate(shoe):
+                after_first = _remove(shoe, first)
+                for second, second_count in enumerate(after_first):
+                    if first_count and second_count:
+                        composition = _remove(after_first, second)
+                        total, soft_aces = _add(*_add(0, 0, VALUES[first]), VALUES[second])
+                        key = (composition, total, soft_aces)
+                        hands[key] = hands.get(key, 0.0) + first_count / sum(shoe) * second_count / sum(after_first)
+
+            # Work through the hands a card at a time, following every hit that does not bust
+            while hands:
+                next_hands = {}
+                for (composition, total, soft_aces), weight in hands.items():
+                    stand, hit = self.evs(composition, total, soft_aces, upcard)
+                    entry = sums.setdefault((total, soft_aces > 0, upcard), [0.0, 0.0, 0.0])
+                    entry[0] += weight
+                    entry[1] += weight * stand
+                    entry[2] += weight * hit
+
+                    cards = sum(composition)
+                    for index, count in enumerate(composition):
+                        if count:
+                            new_total, new_soft = _add(total, soft_aces, VALUES[index])
+                            if new_total <= 21:
+                                key = (_remove(composition, index), new_total, new_soft)
+                                next_hands[key] = next_hands.get(key, 0.0) + weight * count / cards
+                hands = next_hands
+
+        return {key: (stand / weight, hit / weight) for key, (weight, stand, hit) in sums.items()}
+
+
+class Strategy:
+    """| The solved table, for O(1) hints: should the player hit? |"""
+
+    def __init__(self, evs):
+        """| Initialize from {(total, soft, upcard): (EV of standing, EV of hitting)} |"""
+        self.evs = evs
+
+    def lookup(self, total, soft, upcard):
+        """| Return ('hit' or 'stand', EV of standing, EV of hitting); upcard is the card's value (11 for an ace) |"""
+        stand, hit = self.evs[(total, bool(soft), upcard)]
+        return ('hit' if hit > stand else 'stand'), stand, hit
+
+    def should_hit(self, total, soft, upcard):
+        """| True if hitting has the higher EV |"""
+        return self.lookup(total, soft, upcard)[0] == 'hit'
+
+
+def strategy_path(decks, cache_dir=CACHE_DIR):
+    """| Return where the table for this many decks is cached |"""
+    return os.path.join(cache_dir, f"strategy-{decks}d-v{STRATEGY_VERSION}.json")
+
+
+def _write_json(rows, path):
+    """| Write the strategy rows to a JSON file |"""
+    with open(path, 'w') as file:
+        json.dump(rows, file)
+
+
+def load_strategy(decks=1, cache_dir=CACHE_DIR):
+    """| Return the strategy for a shoe of this many decks, solving and caching it the first time |"""
+    path = strategy_path(decks, cache_dir)
+    try:
+        with open(path) as file:
+            rows = json.load(file)
+        return Strategy({(total, soft, upcard): (stand, hit) for total, soft, upcard, stand, hit in rows})
+    except (OSError, ValueError, TypeError):
+        pass  # Not cached yet, or unreadable: solve it again
+
+    evs = StrategySolver(decks).table()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        rows = [[total, soft, upcard, stand, hit] for (total, soft, upcard), (stand, hit) in sorted(evs.items())]
+        write_atomically(path, partial(_write_json, rows))  # Two games may solve at once
+    except OSError as e:
+        print(f"Could not cache the Blackjack strategy at {path}: {e}")
+    return Strategy(evs)
+
+
+def main(argv=None):
+    """| Parse arguments, solve (or load) the table and print it as a chart |"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Optimal hit/stand chart for the Blackjack mini-game.")
+    parser.add_argument('--decks', type=int, default=1, choices=range(1, 9), help="decks in the shoe")
+    parser.add_argument('--no-cache', action='store_true', help="solve again instead of using the cached table")
+    parser.add_argument('--check', action='store_true', help="check the solver's hand totals against cards.Hand first")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        print(f"hand totals agree with cards.Hand in {check_totals()} cases")
+
+    start = time.perf_counter()
+    if args.no_cache:
+        strategy = Strategy(StrategySolver(args.decks).table())
+    else:
+        strategy = load_strategy(args.decks)
+    print(f"{args.decks}-deck table ready in {time.perf_counter() - start:.2f} s; H = hit, S = stand")
+
+    print('       ' + ''.join(f"{'A' if upcard == ACE_VALUE else upcard:>3}" for upcard in VALUES))
+    for soft in (False, True):
+        for total in range(12 if soft else 4, 22):
+            if any((total, soft, upcard) in strategy.evs for upcard in VALUES):
+                cells = ''.join(f"{'HS'[not strategy.should_hit(total, soft, upcard)] if (total, soft, upcard) in strategy.evs else '-':>3}"
+                                for upcard in VALUES)
+                print(f"{'soft' if soft else 'hard'} {total:>2}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import hashlib
+import os
+from functools import partial
+
+import pygame
+
+from assets import assets
+from atomic_file import write_atomically
+from cards import DECK_SIZE, RANKS, card_rank, card_suit, is_red
+from text_cache import text_cache
+
+CACHE_DIR = os.path.join('cache', 'cards')
+ATLAS_VERSION = 1  # Bump when the card layout changes, so old sheets are rebuilt
+
+
+class CardAtlas:
+    """| Every card face on one sprite sheet; a card is drawn by blitting its area of the sheet |"""
+
+    def __init__(self, sheet, card_size):
+        """| Initialize the atlas from a sheet holding the cards in rows of suits and columns of ranks |"""
+        self.sheet = sheet
+        width, height = card_size
+        self.rects = [pygame.Rect((card % len(RANKS)) * width, (card // len(RANKS)) * height, width, height)
+                      for card in range(DECK_SIZE)]
+
+    def draw(self, surface, card, position):
+        """| Draw a card with its top-left corner at position |"""
+        surface.blit(self.sheet, position, self.rects[card])
+
+
+def atlas_path(font_name, font_size, card_size, colors, cache_dir=CACHE_DIR):
+    """| Return where the sheet for these fonts, sizes and colours is cached |"""
+    description = repr((ATLAS_VERSION, font_name, font_size, tuple(card_size), tuple(colors)))
+    return os.path.join(cache_dir, f"cards-{hashlib.sha256(description.encode()).hexdigest()[:16]}.bmp")
+
+
+def build_sheet(font_name, font_size, card_size, colors):
+    """
+    Render all 52 cards onto one surface.
+    :param colors: (face, border, red suits, black suits) colours.
+    """
+    width, height = card_size
+    face, border, red, black = colors
+    font = text_cache.font(font_name, font_size, sysfont=True)
+    sheet = pygame.Surface((width * len(RANKS), height * DECK_SIZE // len(RANKS)))
+
+    for card in range(DECK_SIZE):
+        x, y = (card % len(RANKS)) * width, (card // len(RANKS)) * height
+        rank, suit = card_rank(card), card_suit(card)
+        color = red if is_red(card) else black
+
+        # Blank card with a border
+        sheet.fill(face, (x, y, width, height))
+        pygame.draw.rect(sheet, border, (x, y, width, height), 2)
+
+        # Rank in the top-left and bottom-right corners, suit in the middle
+        text_rank = font.render(rank, True, color)
+        sheet.blit(text_rank, (x + 10, y + 10))
+        text_center = font.render(suit, True, color)
+        sheet.blit(text_center, (x + (width - text_center.get_width()) // 2,
+                                 y + (height - text_center.get_height()) // 2))
+        sheet.blit(text_rank, (x + width - text_rank.get_width() - 10, y + height - text_rank.get_height() - 10))
+    return sheet
+
+
+def load_card_atlas(font_name, font_size, card_size, colors, cache_dir=CACHE_DIR):
+    """
+    Return the card atlas, building and saving the sheet the first time these settings are used.
+    Later runs load one image instead of looking up the font and rendering 156 pieces of text;
+    within a run the sheet is shared through the asset cache.
+    """
+    path = atlas_path(font_name, font_size, card_size, colors, cache_dir)
+    if not os.path.exists(path):
+        sheet = build_sheet(font_name, font_size, card_size, colors)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            write_atomically(path, partial(pygame.image.save, sheet), suffix='.tmp.bmp')  # Two games may start at once
+        except (OSError, pygame.error) as e:
+            print(f"Could not cache the card atlas at {path}: {e}")
+            return CardAtlas(sheet, card_size)
+    return CardAtlas(assets.load_image(path), card_size)
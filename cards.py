@@ -0,0 +1,187 @@
+# Playing cards as small integers: card = suit * 13 + rank, so a deck is simply range(52)
+import random
+from array import array
+
+SUITS = ('♥', '♦', '♠', '♣')
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+DECK_SIZE = len(SUITS) * len(RANKS)
+ACE = RANKS.index('A')
+
+# Blackjack value of each rank (aces count 11 until that would bust the hand)
+RANK_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+
+# Lookup tables indexed by card
+CARD_VALUES = tuple(RANK_VALUES[card % len(RANKS)] for card in range(DECK_SIZE))
+CARD_NAMES = tuple(RANKS[card % len(RANKS)] + SUITS[card // len(RANKS)] for card in range(DECK_SIZE))
+
+
+def make_card(rank, suit):
+    """| Return the card for a rank ('2'..'A') and suit ('♥', '♦', '♠' or '♣') |"""
+    return SUITS.index(suit) * len(RANKS) + RANKS.index(rank)
+
+
+def card_rank(card):
+    """| Return the rank name of a card ('2'..'A') |"""
+    return RANKS[card % len(RANKS)]
+
+
+def card_suit(card):
+    """| Return the suit symbol of a card |"""
+    return SUITS[card // len(RANKS)]
+
+
+def card_name(card):
+    """| Return a card as text, e.g. '10♥' |"""
+    return CARD_NAMES[card]
+
+
+def is_red(card):
+    """| Return True for hearts and diamonds |"""
+    return card < 2 * len(RANKS)
+
+
+def new_deck():
+    """| Return an unshuffled deck as a list of cards |"""
+    return list(range(DECK_SIZE))
+
+
+class Hand:
+    """| A Blackjack hand that keeps its total up to date as cards are added |"""
+
+    def __init__(self, cards=()):
+        """| Initialize a hand, optionally with some cards |"""
+        self.cards = []
+        self.value = 0  # Best total: aces count 11 unless that would bust
+        self.soft_aces = 0  # Aces currently counted as 11
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        """| Add a card and update the total in O(1) |"""
+        self.cards.append(card)
+        value = CARD_VALUES[card]
+        self.value += value
+        if value == 11:
+            self.soft_aces += 1
+        while self.value > 21 and self.soft_aces:  # At most twice, when an ace joins a soft hand
+            self.value -= 10
+            self.soft_aces -= 1
+
+    @property
+    def is_soft(self):
+        """| True if an ace is counted as 11 |"""
+        return self.soft_aces > 0
+
+    @property
+    def is_bust(self):
+        """| True if the total is over 21 |"""
+        return self.value > 21
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __getitem__(self, index):
+        return self.cards[index]
+
+    def __repr__(self):
+        return f"Hand({' '.join(CARD_NAMES[card] for card in self.cards)}: {self.value})"
+
+
+class Shoe:
+    """
+    One to eight decks shuffled together and dealt by moving an index through a preallocated array,
+    so a round costs O(cards dealt) rather than O(deck). A cut card at the penetration decides when the
+    whole shoe is reshuffled: never mid-round, but before the first round that starts past it.
+    """
+
+    MAX_DECKS = 8
+
+    def __init__(self, decks=1, penetration=0.75, seed=None):
+        """
+        Initialize and shuffle the shoe.
+        :param penetration: Fraction of the shoe dealt before the cut card comes out (0 < penetration <= 1).
+        """
+        if not 1 <= decks <= self.MAX_DECKS:
+            raise ValueError(f"a shoe holds 1 to {self.MAX_DECKS} decks, not {decks}")
+        if not 0 < penetration <= 1:
+            raise ValueError(f"penetration must be in (0, 1], not {penetration}")
+        self.decks = decks
+        self.cards = array('B', range(DECK_SIZE)) * decks  # Cards before position are dealt
+        self.cut = max(1, int(len(self.cards) * penetration))  # Position of the cut card
+        self.rng = random.Random(seed)
+        self.position = 0  # Next card to deal
+        self.round_start = 0  # First card of the current round; cards from here to position are in play
+        self.shuffles = 0  # Times the whole shoe has been shuffled
+        self.shuffle()
+
+    def _shuffle_from(self, start):
+        """| Fisher-Yates over the cards from start to the end of the shoe |"""
+        cards, randbelow = self.cards, self.rng.randrange
+        for i in range(len(cards) - 1, start, -1):
+            j = start + randbelow(i - start + 1)
+            cards[i], cards[j] = cards[j], cards[i]
+
+    def shuffle(self):
+        """| Gather every card and shuffle the whole shoe |"""
+        self._shuffle_from(0)
+        self.position = self.round_start = 0
+        self.shuffles += 1
+
+    def shuffle_remaining(self):
+        """| Shuffle only the cards not dealt yet |"""
+        self._shuffle_from(self.position)
+
+    @property
+    def cut_card_reached(self):
+        """| True once the cut card has come out; the shoe is shuffled before the next round |"""
+        return self.position >= self.cut
+
+    def start_round(self):
+        """| Begin a round, shuffling first if the cut card came out; return True if it shuffled |"""
+        if self.cut_card_reached:
+            self.shuffle()
+            return True
+        self.round_start = self.position
+        return False
+
+    def _reshuffle_discards(self):
+        """
+        The shoe ran out mid-round: keep the cards in play at the front and shuffle
+        every earlier round's discards behind them.
+        """
+        in_play = self.cards[self.round_start:self.position]
+        if len(in_play) == len(self.cards):
+            raise IndexError("every card of the shoe is in play")
+        discards = self.cards[:self.round_start]
+        self.cards[:len(in_play)] = in_play
+        self.cards[len(in_play):] = discards
+        self.position = len(in_play)
+        self.round_start = 0
+        self._shuffle_from(self.position)
+        self.shuffles += 1
+
+    def deal(self):
+        """| Return the next card |"""
+        if self.position == len(self.cards):
+            self._reshuffle_discards()
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+    def peek(self, count):
+        """| Return the next count cards without dealing them |"""
+        return list(self.cards[self.position:self.position + count])
+
+    @property
+    def remaining(self):
+        """| Number of cards left before the end of the shoe |"""
+        return len(self.cards) - self.position
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __repr__(self):
+        return f"Shoe(decks={self.decks}: {self.remaining} of {len(self.cards)} cards left, cut at {self.cut})"
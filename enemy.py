@@ -1,45 +1,73 @@
-from typing import Optional, Any
+from typing import Optional, Any, List
 from pygame.surface import Surface
 from pygame import Rect
 import pygame
 
+from assets import assets
+
 
 class Enemy:
     """| Class to manage enemies |"""
 
-    def __init__(self, game, x: int = 500, y: int = 300, image_path: str = 'images/enemy.bmp') -> None:
+    def __init__(self, game, x: int = 500, y: int = 300, image_path: str = 'images/enemy.bmp',
+                 encounter: Optional[str] = None) -> None:
         """
         Initialize the enemy and set its starting position.
         :param game: Instance of AnAdventure, providing settings and screen attributes.
+        :param encounter: What happens when the player comes close ('blackjack', 'dialog' or None).
         """
         self.screen: Optional[Surface] = game.screen # Allowing for the possibility that screen might be None.
         self.settings: Optional[Any] = game.settings # Allowing settings to be of any type and potentially None.
+        self.encounter: Optional[str] = encounter
 
         self.image: Surface = self._load_image(image_path)
 
-        # Set its rectangular position and size.
-        self.rect: Rect = self.image.get_rect()  #The rectangle for positioning.
-        self.rect.x = x
-        self.rect.y = y
+        # Position and size live in the game's entity store; this object is a view of one slot.
+        self.store = game.entities
+        self.index: int = self.store.add(x, y, *self.image.get_size())
+
+        # Where the enemy was last drawn, for dirty-rectangle rendering
+        self.drawn_rect: Optional[Rect] = None
+
+    @property
+    def x(self) -> float:
+        """| The enemy's exact horizontal position |"""
+        return float(self.store.pos[self.index][0])
+
+    @property
+    def y(self) -> float:
+        """| The enemy's exact vertical position |"""
+        return float(self.store.pos[self.index][1])
+
+    @property
+    def rect(self) -> Rect:
+        """| A Rect of the enemy's current (integer) position |"""
+        return Rect(self.store.rect_of(self.index))
 
-        # Store the position as floats for fine-tuned movement.
-        self.x: float = float(self.rect.x)
-        self.y: float = float(self.rect.y)
+    @property
+    def draw_rect(self) -> Rect:
+        """| Where to draw the enemy: its position interpolated between simulation ticks |"""
+        return Rect(self.store.draw_rect_of(self.index))
 
     def _load_image(self, image_path: str) -> Surface:
-        """| Load the specified enemy image (default: 'enemy.bmp') |"""
+        """| Load the specified enemy image (default: 'enemy.bmp'), shared with other enemies |"""
         try:
-            return pygame.image.load(image_path)
+            return assets.load_image(image_path)
         except pygame.error as e:
             print(f"Error loading enemy image at {image_path}: {e}")
             raise
 
     def update(self) -> None:
-        """| Update the enemy's position or behavior (if any) |"""
+        """| Update the enemy's behavior (if any); movement happens in the entity store's step() |"""
 
-        # This is for a simple vertical movement example, expand as needed.
-        self.rect.y = int(self.y)  # Sync rectangle with position.
+    def release(self) -> None:
+        """| Free the enemy's slot in the entity store once it has left the game |"""
+        self.store.remove(self.index)
 
-    def blitme(self) -> None:
-        """| Draw the enemy’s image at its current location (using its Rect) |"""
-        self.screen.blit(self.image, self.rect)
+    def blitme(self) -> List[Rect]:
+        """| Draw the enemy’s image at its current location and return the old and new areas touched |"""
+        draw_rect = self.draw_rect
+        self.screen.blit(self.image, draw_rect)
+        dirty = [draw_rect] if self.drawn_rect is None else [self.drawn_rect, draw_rect]
+        self.drawn_rect = draw_rect
+        return dirty
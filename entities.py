@@ -0,0 +1,163 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to plain lists
+    np = None
+
+
+class EntityStore:
+    """| Structure-of-arrays storage (NumPy) for entity positions, velocities and sizes |"""
+
+    def __init__(self, bounds, capacity=64):
+        """
+        Initialize an empty store.
+        :param bounds: (width, height) of the area entities are clamped to.
+        :param capacity: Initial number of slots; the arrays grow as needed.
+        """
+        self.bounds = np.array(bounds, dtype=float)
+        self.count = 0  # Slots in use (including freed ones waiting to be reused)
+        self._free = []  # Indices of removed entities
+
+        self.pos = np.zeros((capacity, 2), dtype=float)  # Exact x, y
+        self.prev_pos = np.zeros((capacity, 2), dtype=float)  # Exact x, y before the last step
+        self.vel = np.zeros((capacity, 2), dtype=float)  # Pixels per step
+        self.size = np.zeros((capacity, 2), dtype=float)  # Width, height
+        self.rects = np.zeros((capacity, 4), dtype=int)  # Integer x, y, width, height
+        self.draw_rects = np.zeros((capacity, 4), dtype=int)  # Rects interpolated for rendering
+
+    def add(self, x, y, width, height):
+        """| Add an entity and return its index |"""
+        if self._free:
+            index = self._free.pop()
+        else:
+            if self.count == len(self.pos):
+                self._grow()
+            index = self.count
+            self.count += 1
+
+        self.vel[index] = (0, 0)
+        self.size[index] = (width, height)
+        self.place(index, x, y)
+        return index
+
+    def place(self, index, x, y):
+        """| Put an entity at a position without interpolating from where it was |"""
+        self.pos[index] = self.prev_pos[index] = (x, y)
+        self.rects[index] = self.draw_rects[index] = (int(x), int(y), *self.size[index])
+
+    def remove(self, index):
+        """| Free an entity's slot for reuse |"""
+        self.vel[index] = (0, 0)
+        self._free.append(index)
+
+    def _grow(self):
+        """| Double the capacity of every array |"""
+        self.pos = np.concatenate((self.pos, np.zeros_like(self.pos)))
+        self.prev_pos = np.concatenate((self.prev_pos, np.zeros_like(self.prev_pos)))
+        self.vel = np.concatenate((self.vel, np.zeros_like(self.vel)))
+        self.size = np.concatenate((self.size, np.zeros_like(self.size)))
+        self.rects = np.concatenate((self.rects, np.zeros_like(self.rects)))
+        self.draw_rects = np.concatenate((self.draw_rects, np.zeros_like(self.draw_rects)))
+
+    def step(self):
+        """
+        Move every entity by its velocity, clamp it to the bounds and sync the integer rects.
+        :return: Boolean array telling which entities moved.
+        """
+        n = self.count
+        pos = self.pos[:n]
+        new_pos = np.clip(pos + self.vel[:n], 0, self.bounds - self.size[:n])
+        moved = (new_pos != pos).any(axis=1)
+        self.prev_pos[:n] = pos
+        pos[:] = new_pos
+        self.rects[:n, :2] = new_pos  # Truncates like int(); positions are never negative
+        return moved
+
+    def interpolate(self, alpha):
+        """| Set the draw rects to a blend of the previous and current positions (alpha 0..1) |"""
+        n = self.count
+        prev = self.prev_pos[:n]
+        self.draw_rects[:n, :2] = prev + (self.pos[:n] - prev) * alpha
+
+    def rect_of(self, index):
+        """| Return (x, y, width, height) of an entity as plain ints |"""
+        return self.rects[index].tolist()
+
+    def draw_rect_of(self, index):
+        """| Return the interpolated (x, y, width, height) of an entity as plain ints |"""
+        return self.draw_rects[index].tolist()
+
+
+class ListEntityStore:
+    """| Pure-Python EntityStore with the same interface, used when NumPy is not installed |"""
+
+    def __init__(self, bounds, capacity=64):
+        """| Initialize an empty store; capacity is accepted for compatibility |"""
+        self.bounds = bounds
+        self.count = 0
+        self._free = []
+        self.pos = []
+        self.prev_pos = []
+        self.vel = []
+        self.size = []
+        self.rects = []
+        self.draw_rects = []
+
+    def add(self, x, y, width, height):
+        """| Add an entity and return its index |"""
+        columns = (self.pos, self.prev_pos, self.vel, self.size, self.rects, self.draw_rects)
+        entry = ([0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [width, height], [0, 0, width, height], [0, 0, width, height])
+        if self._free:
+            index = self._free.pop()
+            for column, value in zip(columns, entry):
+                column[index] = value
+        else:
+            index = self.count
+            self.count += 1
+            for column, value in zip(columns, entry):
+                column.append(value)
+        self.place(index, x, y)
+        return index
+
+    def place(self, index, x, y):
+        """| Put an entity at a position without interpolating from where it was |"""
+        self.pos[index][:] = self.prev_pos[index][:] = [float(x), float(y)]
+        self.rects[index][:2] = self.draw_rects[index][:2] = [int(x), int(y)]
+
+    def remove(self, index):
+        """| Free an entity's slot for reuse |"""
+        self.vel[index] = [0.0, 0.0]
+        self._free.append(index)
+
+    def step(self):
+        """| Move, clamp and sync every entity; return a list telling which entities moved |"""
+        max_x, max_y = self.bounds
+        moved = []
+        for pos, prev, vel, size, rect in zip(self.pos, self.prev_pos, self.vel, self.size, self.rects):
+            x = min(max(pos[0] + vel[0], 0), max_x - size[0])
+            y = min(max(pos[1] + vel[1], 0), max_y - size[1])
+            moved.append(x != pos[0] or y != pos[1])
+            prev[0], prev[1] = pos
+            pos[0], pos[1] = x, y
+            rect[0], rect[1] = int(x), int(y)
+        return moved
+
+    def interpolate(self, alpha):
+        """| Set the draw rects to a blend of the previous and current positions (alpha 0..1) |"""
+        for pos, prev, draw_rect in zip(self.pos, self.prev_pos, self.draw_rects):
+            draw_rect[0] = int(prev[0] + (pos[0] - prev[0]) * alpha)
+            draw_rect[1] = int(prev[1] + (pos[1] - prev[1]) * alpha)
+
+    def rect_of(self, index):
+        """| Return (x, y, width, height) of an entity as plain ints |"""
+        return list(self.rects[index])
+
+    def draw_rect_of(self, index):
+        """| Return the interpolated (x, y, width, height) of an entity as plain ints |"""
+        return list(self.draw_rects[index])
+
+
+def create_entity_store(bounds, capacity=64):
+    """| Return a NumPy-backed store when NumPy is available, otherwise the list-based one |"""
+    if np is not None:
+        return EntityStore(bounds, capacity)
+    return ListEntityStore(bounds, capacity)
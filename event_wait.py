@@ -0,0 +1,28 @@
+import time
+
+import pygame
+
+
+def wait_for_event(timeout=None, event_types=None):
+    """
+    Sleep until an event arrives and return it, without spinning the CPU.
+    :param timeout: Longest time to wait in milliseconds; None waits forever.
+    :param event_types: Only return events of these types; other events are discarded.
+    :return: The event, or None if the timeout expired first.
+    """
+    # A monotonic clock rather than pygame.time.get_ticks(), which stays at 0 without pygame.init()
+    deadline = None if timeout is None else time.monotonic() * 1000 + timeout
+
+    while True:
+        if deadline is None:
+            event = pygame.event.wait()
+        else:
+            remaining = int(deadline - time.monotonic() * 1000)
+            if remaining <= 0:
+                return None
+            event = pygame.event.wait(remaining)
+            if event.type == pygame.NOEVENT:  # Timed out
+                return None
+
+        if event_types is None or event.type in event_types:
+            return event
@@ -1,5 +1,7 @@
 import pygame
 
+from assets import assets
+
 
 class Human:
     """| A class to manage the player |"""
@@ -11,16 +13,19 @@ class Human:
         self.settings = adventure_game.settings
         self.screen_rect = adventure_game.screen.get_rect()
 
-        # Load the human image and get its rectangle
-        self.image = pygame.image.load('images/human.bmp')
-        self.rect = self.image.get_rect()
+        # Load the human image (shared through the asset cache)
+        self.image = assets.load_image('images/human.bmp')
+
+        # Position, velocity and size live in the game's entity store; this object is a view of one slot.
+        # Start each new human at the top left corner of the screen
+        self.store = adventure_game.entities
+        self.index = self.store.add(self.screen_rect.left, self.screen_rect.top, *self.image.get_size())
 
-        # Start each new human at the bottom center of the screen
-        self.rect.topleft = self.screen_rect.topleft
+        # Level whose walls block movement (a MazeLevel), or None for the open screen
+        self.level = None
 
-        # Store a float for the human's exact horizontal position
-        self.x = float(self.rect.x)  # | self.x = self.rect.x |
-        self.y = float(self.rect.y)  # | self.y = self.rect.y |
+        # Where the human was last drawn, for dirty-rectangle rendering
+        self.drawn_rect = None
 
         # Movement flags; start with a human that's not moving
         self.moving_right = False
@@ -28,36 +33,56 @@ class Human:
         self.moving_up = False
         self.moving_down = False
 
-    def update(self):
-        """| Update the human's position based on the movement flag |"""
+    @property
+    def x(self):
+        """| The human's exact horizontal position |"""
+        return float(self.store.pos[self.index][0])
 
-        moved = False  # Add a moved flag
+    @x.setter
+    def x(self, value):
+        self.store.place(self.index, value, self.y)
 
-        # Update the human's x value, not the rect
+    @property
+    def y(self):
+        """| The human's exact vertical position |"""
+        return float(self.store.pos[self.index][1])
 
-        # Check if the character is moving to the right and hasn't reached the screen's right edge.
-        if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.x += self.settings.human_speed_factor  # Move right by increasing x-coordinate
-            moved = True  # Mark as moved
-        if self.moving_left and self.rect.left > 0:  # check left and if reached the screen's left edge
-            self.x -= self.settings.human_speed_factor  # Move left by decreasing x-coordinate
-            moved = True  # Mark as moved
-        if self.moving_up and self.rect.top > 0:
-            self.y -= self.settings.human_speed_factor
-            moved = True  # Mark as moved
-        if self.moving_down and self.rect.bottom < self.screen_rect.bottom:
-            self.y += self.settings.human_speed_factor
-            moved = True  # Mark as moved
+    @y.setter
+    def y(self, value):
+        self.store.place(self.index, self.x, value)
 
-        # Update rect object from self.x
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+    @property
+    def rect(self):
+        """| A Rect of the human's current (integer) position; changing it does not move the human |"""
+        return pygame.Rect(self.store.rect_of(self.index))
 
-        return moved  # Return the movement flag
+    @property
+    def draw_rect(self):
+        """| Where to draw the human: its position interpolated between simulation ticks |"""
+        return pygame.Rect(self.store.draw_rect_of(self.index))
+
+    def update(self):
+        """
+        | Steer the human based on the movement flags |
+        The move itself (and clamping to the screen) happens for all entities at once in the
+        entity store's step(); in a level the velocity is first cut short at the walls.
+        Returns True if the human is trying to move.
+        """
+        speed = self.settings.human_speed_factor
+        dx = (self.moving_right - self.moving_left) * speed
+        dy = (self.moving_down - self.moving_up) * speed
+        if self.level is not None and (dx or dy):
+            dx, dy = self.level.clip_move(self.store.rect_of(self.index), dx, dy)
+        self.store.vel[self.index] = (dx, dy)
+        return dx != 0 or dy != 0
 
     def blitme(self):
-        """| Draw the human at its current location |"""
-        self.screen.blit(self.image, self.rect)
+        """| Draw the human at its current location and return the old and new areas touched |"""
+        draw_rect = self.draw_rect
+        self.screen.blit(self.image, draw_rect)
+        dirty = [draw_rect] if self.drawn_rect is None else [self.drawn_rect, draw_rect]
+        self.drawn_rect = draw_rect
+        return dirty
 
     def reset_movement(self):
         """Reset all movement flags to stop the human from moving."""
@@ -1,108 +1,392 @@
 # Python Maze Generator with Depth-First Search Algorithm
 
-import pygame
-from random import choice
-from settings import Settings
-
-# Initialize game settings using Settings class
-game_settings = Settings()
-
-# Access necessary settings such as screen dimensions via the Settings object
-RESOLUTION = WIDTH, HEIGHT = game_settings.screen_width, game_settings.screen_height  # Game resolution
-TILE = 100  # Size of each tile in the grid
-cols, rows = WIDTH // TILE, HEIGHT // TILE  # Calculate the number of columns and rows in the grid based on resolution
-
-# Initialize pygame for rendering the game window and managing events
-pygame.init()
-
-# Create a window with the specified resolution
-screen = pygame.display.set_mode(RESOLUTION)
-
-# Create a clock object to control the frame rate
-clock = pygame.time.Clock()
-
-
-# Class to represent a single cell in the maze
-class Cell:
-    def __init__(self, x, y):
-        """| Initialize cell with its coordinates. Each cell starts with all walls intact and is unvisited |"""
-        self.x, self.y = x, y  # Coordinates of the cell in the grid
-        # Walls dictionary to define which walls are present around the cell
-        self.walls = {"top": True, "right": True, "bottom": True, "left": True}
-        self.visited = False  # Flag to check if the cell has already been visited during maze generation
-
-    def draw_current_cell(self):
-        x, y = self.x * TILE, self.y * TILE
-        pygame.draw.rect(screen, pygame.Color('saddlebrown'), (x + 2, y + 2, TILE - 2, TILE - 2))
-
-    def draw(self):
-        """| Draw the cell on the screen. Visited - filled black, walls - in dark orange |"""
-        x, y = self.x * TILE, self.y * TILE  # Convert cell coordinates to pixels
-        if self.visited:
-            # Fill the cell's area with a black rectangle if visited
-            pygame.draw.rect(screen, pygame.Color('black'), (x, y, TILE, TILE))
-
-        # Draw the walls of the cell
-        if self.walls["top"]:
-            pygame.draw.line(screen, pygame.Color('darkorange'), (x, y), (x + TILE, y), 2)
-        if self.walls["right"]:
-            pygame.draw.line(screen, pygame.Color('darkorange'), (x + TILE, y), (x + TILE, y + TILE), 2)
-        if self.walls["bottom"]:
-            pygame.draw.line(screen, pygame.Color('darkorange'), (x + TILE, y + TILE), (x, y + TILE), 2)
-        if self.walls["left"]:
-            pygame.draw.line(screen, pygame.Color('darkorange'), (x, y + TILE), (x, y), 2)
-
-    def check_cell(self, x, y):
-        """| Return a neighboring cell if it's within the grid, otherwise return False |"""
-        find_index = lambda x, y: x + y * cols
-        if x < 0 or x > cols - 1 or y < 0 or y > rows - 1:
-            return False
-        return grid_cells[find_index(x, y)]
-
-    def check_neighbors(self):
-        """| Check the neighbors of the cell and return a random unvisited neighbor |"""
+import random
+import time
+
+# Wall bits of a cell's bitmask
+TOP, RIGHT, BOTTOM, LEFT = 1, 2, 4, 8
+ALL_WALLS = TOP | RIGHT | BOTTOM | LEFT
+SIDES = (TOP, RIGHT, BOTTOM, LEFT)  # Indexed by direction: 0 up, 1 right, 2 down, 3 left
+OPPOSITE = (BOTTOM, LEFT, TOP, RIGHT)  # The wall a neighbour shares, by direction
+
+TILE = 100  # Size of each tile in the grid (pixels), for the animated viewer
+
+# Cell codes used while carving: 0 unvisited, 1-4 entered moving in direction code - 1,
+# START for the first cell and BORDER for the padding around the grid
+_START, _BORDER = 5, 6
+
+
+class Maze:
+    """| A maze stored as one wall bitmask per cell in a row-major bytearray |"""
+
+    def __init__(self, cols, rows, walls=None, seed=None, algorithm='backtracker'):
+        """
+        Initialize a maze.
+        :param walls: cols * rows wall bitmasks (TOP | RIGHT | BOTTOM | LEFT); all walls up if None.
+        :param seed: Seed the maze was generated from, so it can be regenerated.
+        :param algorithm: Name of the algorithm that generated it.
+        """
+        self.cols, self.rows = cols, rows
+        self.walls = walls if walls is not None else bytearray([ALL_WALLS]) * (cols * rows)
+        self.seed = seed
+        self.algorithm = algorithm
+
+    def index(self, x, y):
+        """| Return the position of cell (x, y) in the walls array |"""
+        return x + y * self.cols
+
+    def walls_at(self, x, y):
+        """| Return the wall bitmask of cell (x, y) |"""
+        return self.walls[x + y * self.cols]
+
+    def has_wall(self, x, y, side):
+        """| Return True if cell (x, y) has the given wall (TOP, RIGHT, BOTTOM or LEFT) |"""
+        return bool(self.walls[x + y * self.cols] & side)
+
+    def open_neighbors(self, x, y):
+        """| Return the cells reachable from (x, y) in one step |"""
+        walls = self.walls[x + y * self.cols]
         neighbors = []
-        top = self.check_cell(self.x, self.y - 1)
-        right = self.check_cell(self.x + 1, self.y)
-        bottom = self.check_cell(self.x, self.y + 1)
-        left = self.check_cell(self.x - 1, self.y)
-        if top and not top.visited:
-            neighbors.append(top)
-        if right and not right.visited:
-            neighbors.append(right)
-        if bottom and not bottom.visited:
-            neighbors.append(bottom)
-        if left and not left.visited:
-            neighbors.append(left)
-        return choice(neighbors) if neighbors else False
-
-# Create a grid of cells for the maze
-grid_cells = [Cell(col, row) for row in range(rows) for col in range(cols)]  # Flattened cell grid list
-current_cell = grid_cells[0]  # Start at the first cell in the grid
-stack = []  # Stack to hold the path
-
-# Main game loop
-while True:
-    screen.fill(pygame.Color('darkslategray'))  # Fill the screen with the background color
-
-    # Handle game events
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            exit()
-
-    # Draw all cells (walls and visited states) on the screen
-    [cell.draw() for cell in grid_cells]
-    current_cell.visited = True
-    current_cell.draw_current_cell() # Highlight the current cell
-
-    # Check if there is an unvisited neighboring cell
-    next_cell = current_cell.check_neighbors()
-    if next_cell:
-        next_cell.visited = True
-        current_cell = next_cell # Move to the next cell
-
-    # Update display
+        if not walls & TOP:
+            neighbors.append((x, y - 1))
+        if not walls & RIGHT:
+            neighbors.append((x + 1, y))
+        if not walls & BOTTOM:
+            neighbors.append((x, y + 1))
+        if not walls & LEFT:
+            neighbors.append((x - 1, y))
+        return neighbors
+
+
+def _direction_table(width):
+    """
+    Return the directions to try from a cell, indexed by cell code * 8 + a random 3-bit number.
+    Each entry lists (offset, code) pairs in one of 8 orders (4 rotations, both ways round),
+    skipping the direction the cell was entered from. Offsets are for a grid padded to `width`.
+    """
+    offsets = (-width, 1, width, -1)
+    orders = []
+    for first in range(4):
+        orders.append([(first + k) % 4 for k in range(4)])
+        orders.append([(first - k) % 4 for k in range(4)])
+
+    table = []
+    for code in range(8):
+        back = (code + 1) % 4 if 1 <= code <= 4 else None  # Direction leading to the parent
+        for order in orders:
+            table.append(tuple((offsets[d], d + 1) for d in order if d != back))
+    return table
+
+
+def _padded_cells(cols, rows):
+    """| Return the carving codes for a grid with a one-cell border marked as visited |"""
+    width = cols + 2
+    cells = bytearray([_BORDER]) * (width * (rows + 2))
+    empty_row = bytes(cols)
+    for y in range(1, rows + 1):
+        cells[y * width + 1:y * width + 1 + cols] = empty_row
+    return cells
+
+
+def _walls_from_codes(cells, cols, rows, band_rows=64):
+    """
+    Turn carving codes into wall bitmasks.
+    A cell entered moving in direction d is open on the side facing back, and its parent is open
+    on side d. Both are computed for a band of rows at a time with bytes.translate and big-int ORs,
+    so the temporaries stay a few bands in size however large the maze is.
+    """
+    width = cols + 2
+    offsets = (-width, 1, width, -1)
+
+    own_side = bytearray(256)
+    parent_sides = []
+    for d in range(4):
+        own_side[d + 1] = OPPOSITE[d]
+        parent_side = bytearray(256)
+        parent_side[d + 1] = SIDES[d]
+        parent_sides.append(parent_side)
+    invert = bytes(ALL_WALLS & ~bits for bits in range(16)) + bytes(240)
+
+    walls = bytearray(cols * rows)
+    for first in range(1, rows + 1, band_rows):
+        last = min(first + band_rows, rows + 1)  # Padded rows first..last-1, plus one row either side
+        band = cells[(first - 1) * width:(last + 1) * width]
+        size = len(band)
+
+        opened = int.from_bytes(band.translate(own_side), 'little')
+        for d in range(4):
+            marks = band.translate(parent_sides[d])  # Marked at the child; the parent is at child - offset
+            offset = offsets[d]
+            shifted = marks[offset:] + bytes(offset) if offset > 0 else bytes(-offset) + marks[:offset]
+            opened |= int.from_bytes(shifted, 'little')
+        padded = opened.to_bytes(size, 'little').translate(invert)
+
+        for y in range(first, last):
+            start = (y - first + 1) * width + 1
+            walls[(y - 1) * cols:y * cols] = padded[start:start + cols]
+    return walls
+
+
+def _backtracker(cols, rows, seed):
+    """| Carve a complete maze with an iterative recursive-backtracker (randomised DFS) |"""
+    rng = random.Random(seed)
+    randbits = rng.getrandbits
+    width = cols + 2
+    table = _direction_table(width)
+    cells = _padded_cells(cols, rows)
+
+    offsets = (-width, 1, width, -1)
+    current = width + 1  # Top-left cell
+    current_code = cells[current] = _START
+
+    while True:
+        for offset, code in table[current_code * 8 + randbits(3)]:
+            neighbor = current + offset
+            if not cells[neighbor]:  # Unvisited: carve into it
+                cells[neighbor] = code
+                current, current_code = neighbor, code
+                break
+        else:  # Dead end: backtrack to the parent, which the cell's code points back to (no stack needed)
+            if current_code == _START:
+                break
+            current -= offsets[current_code - 1]
+            current_code = cells[current]
+
+    return Maze(cols, rows, _walls_from_codes(cells, cols, rows), seed=seed, algorithm='backtracker')
+
+
+def eller_rows(cols, seed=None, rows=None):
+    """
+    Yield the rows of a maze one at a time (bytearrays of cols wall bitmasks) with Eller's algorithm.
+    Only the current row's sets are kept, so memory is O(cols) however many rows are drawn, and the
+    same seed always yields the same rows.
+    :param rows: Total number of rows; the last one is closed off. None streams rows forever
+                 (the first rows of a stream match those of a finite maze with the same seed).
+    """
+    # Checked here rather than in the generator body, so bad arguments fail at the call, not at the first row
+    if cols < 1:
+        raise ValueError(f"A maze needs at least one column, got {cols}")
+    if rows is not None and rows < 1:
+        raise ValueError(f"A maze needs at least one row, got {rows}")
+    return _eller_rows(cols, seed, rows)
+
+
+def _eller_rows(cols, seed, rows):
+    """| Generator behind eller_rows, which validates the arguments |"""
+    rng = random.Random(seed)
+    randbits = rng.getrandbits
+    sets = [-1] * cols  # Set id of each column in the current row; -1 for none yet
+    members = {}  # Set id -> columns of the current row in that set
+    next_id = 0
+    top = bytearray([TOP]) * cols  # Top walls of the current row: columns not carved into from above
+
+    y = 0
+    while rows is None or y < rows:
+        last = rows is not None and y == rows - 1
+
+        # Cells not joined to the row above start their own set
+        for x in range(cols):
+            if sets[x] < 0:
+                sets[x] = next_id
+                members[next_id] = [x]
+                next_id += 1
+
+        # Randomly join neighbours in different sets; the last row joins every remaining set
+        row = bytearray(top)
+        row[0] |= LEFT
+        row[cols - 1] |= RIGHT
+        for x in range(cols - 1):
+            kept, merged = sets[x], sets[x + 1]
+            if kept != merged and (last or randbits(1)):
+                if len(members[kept]) < len(members[merged]):
+                    kept, merged = merged, kept  # Relabel the smaller set
+                for column in members[merged]:
+                    sets[column] = kept
+                members[kept] += members.pop(merged)
+            else:
+                row[x] |= RIGHT
+                row[x + 1] |= LEFT
+
+        if last:
+            for x in range(cols):
+                row[x] |= BOTTOM
+            yield row
+            return
+
+        # Carve down from every set at least once, so no set is cut off from the rest
+        next_sets = [-1] * cols
+        next_members = {}
+        top = bytearray([TOP]) * cols
+        for set_id, columns in members.items():
+            carved = [column for column in columns if randbits(1)]
+            if not carved:
+                carved = [columns[rng.randrange(len(columns))]]
+            for column in carved:
+                next_sets[column] = set_id
+                top[column] = 0
+            next_members[set_id] = carved
+        for x in range(cols):
+            if top[x]:  # Closed below wherever the next row is closed above
+                row[x] |= BOTTOM
+
+        sets, members = next_sets, next_members
+        y += 1
+        yield row
+
+
+def _eller(cols, rows, seed):
+    """| Build a complete maze from Eller's row stream |"""
+    walls = bytearray().join(eller_rows(cols, seed, rows))
+    return Maze(cols, rows, walls, seed=seed, algorithm='eller')
+
+
+GENERATORS = {
+    'backtracker': _backtracker,
+    'eller': _eller,
+}
+
+
+def generate_maze(cols, rows, seed=None, algorithm='backtracker'):
+    """
+    Generate a finished maze.
+    :param seed: Any value accepted by random.Random; a random seed is picked (and stored on the maze) if None.
+    :param algorithm: One of GENERATORS.
+    """
+    if cols < 1 or rows < 1:
+        raise ValueError(f"A maze needs at least one cell, got {cols}x{rows}")
+    if algorithm not in GENERATORS:
+        raise ValueError(f"Unknown maze algorithm {algorithm!r}; choose from {', '.join(GENERATORS)}")
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    return GENERATORS[algorithm](cols, rows, seed)
+
+
+class BacktrackerSteps:
+    """| The same backtracker, one step at a time, for animating the generation |"""
+
+    def __init__(self, cols, rows, seed=None):
+        """| Initialize a maze with all walls up and the current cell at the top left |"""
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        self.maze = Maze(cols, rows, seed=seed, algorithm='backtracker')
+        self._randbits = random.Random(seed).getrandbits
+        self._width = cols + 2
+        self._table = _direction_table(self._width)
+        self._cells = _padded_cells(cols, rows)
+
+        start = self._width + 1
+        self._cells[start] = _START
+        self._stack = [start]
+        self.done = False
+
+    def cell_of(self, padded_index):
+        """| Return the index in maze.walls of a cell in the padded grid |"""
+        y, x = divmod(padded_index, self._width)
+        return (x - 1) + (y - 1) * self.maze.cols
+
+    @property
+    def current(self):
+        """| Index (in maze.walls) of the cell being carved from, or None when finished |"""
+        return self.cell_of(self._stack[-1]) if self._stack else None
+
+    def is_visited(self, index):
+        """| Return True if the cell at an index of maze.walls has been reached |"""
+        y, x = divmod(index, self.maze.cols)
+        return self._cells[(x + 1) + (y + 1) * self._width] != 0
+
+    def step(self):
+        """| Carve into one neighbour or backtrack once; return the maze.walls indices that changed |"""
+        if self.done:
+            return []
+        cells, walls = self._cells, self.maze.walls
+        current = self._stack[-1]
+        for offset, code in self._table[cells[current] * 8 + self._randbits(3)]:
+            neighbor = current + offset
+            if not cells[neighbor]:
+                cells[neighbor] = code
+                self._stack.append(neighbor)
+                direction = code - 1
+                here, there = self.cell_of(current), self.cell_of(neighbor)
+                walls[here] &= ~SIDES[direction]
+                walls[there] &= ~OPPOSITE[direction]
+                return [here, there]
+
+        self._stack.pop()
+        if not self._stack:
+            self.done = True
+        return [self.cell_of(current)]
+
+    def advance(self, steps=1, budget=None):
+        """
+        Run several steps and return the set of cells that changed.
+        :param steps: Steps to run; ignored when a budget is given.
+        :param budget: Seconds to keep stepping for (e.g. a share of the frame time).
+        """
+        changed = set()
+        if budget is None:
+            for _ in range(steps):
+                if self.done:
+                    break
+                changed.update(self.step())
+        else:
+            deadline = time.perf_counter() + budget
+            while not self.done and time.perf_counter() < deadline:
+                changed.update(self.step())
+        return changed
+
+
+def main(argv=None):
+    """| Animate the generation of a screen-sized maze |"""
+    import argparse
+
+    import pygame
+    from maze_view import MazeRenderer
+    from settings import Settings
+
+    parser = argparse.ArgumentParser(description="Watch a maze being generated.")
+    parser.add_argument('-t', '--tile', type=int, default=TILE, help="cell size in pixels")
+    parser.add_argument('-s', '--steps', type=int, default=1, help="generation steps per frame")
+    parser.add_argument('-b', '--budget', type=float,
+                        help="milliseconds of generation per frame; runs as many steps as fit (overrides --steps)")
+    parser.add_argument('--seed', type=int, help="seed for a reproducible maze")
+    args = parser.parse_args(argv)
+
+    # Initialize game settings using Settings class
+    game_settings = Settings()
+
+    # Access necessary settings such as screen dimensions via the Settings object
+    cols = game_settings.screen_width // args.tile  # Number of columns that fit on the screen
+    rows = game_settings.screen_height // args.tile  # Number of rows that fit on the screen
+
+    # Initialize pygame for rendering the game window and managing events
+    pygame.init()
+    screen = pygame.display.set_mode((cols * args.tile, rows * args.tile))
+    clock = pygame.time.Clock()  # Controls the frame rate
+
+    steps = BacktrackerSteps(cols, rows, seed=args.seed)
+    renderer = MazeRenderer(steps.maze, args.tile, steps.is_visited)
+    renderer.draw_full(screen, steps.current)
     pygame.display.flip()
 
-    # Cap the frame rate to the specified FPS (via game settings)
-    clock.tick(game_settings.fps)
+    # Main game loop
+    while True:
+        # Handle game events
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+
+        if args.budget is not None:
+            changed = steps.advance(budget=args.budget / 1000)
+        else:
+            changed = steps.advance(args.steps)
+
+        # Repaint only the cells that changed and push only their areas
+        pygame.display.update(renderer.update(screen, changed, steps.current))
+
+        # Cap the frame rate to the specified FPS (via game settings)
+        clock.tick(game_settings.fps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import math
+
+import pygame
+
+from labyrinth import TOP, RIGHT, BOTTOM, LEFT
+from maze_view import MazeRenderer, WALL_COLOR
+
+
+class MazeLevel:
+    """| A maze laid out as the game world: a pre-rendered background and tile-based wall collision |"""
+
+    def __init__(self, maze, tile, screen_size, floor_color):
+        """
+        Initialize the level and render its background once.
+        :param tile: Size of a maze cell in pixels.
+        :param screen_size: (width, height) of the screen; any area outside the maze is drawn as wall.
+        """
+        self.maze = maze
+        self.tile = tile
+        renderer = MazeRenderer(maze, tile, floor_color=floor_color)
+        self.wall_width = renderer.wall_width  # Walls are bands this thick along the inside of each cell
+
+        self.background = pygame.Surface(screen_size)
+        if pygame.display.get_surface() is not None:
+            self.background = self.background.convert()
+        self.background.fill(WALL_COLOR)
+        self.background.blit(renderer.surface, (0, 0))
+
+    def cell_at(self, x, y):
+        """| Return the (column, row) of the cell containing a point |"""
+        return int(x) // self.tile, int(y) // self.tile
+
+    def centered_in_cell(self, col, row, width, height):
+        """| Return the top-left position that centres a width x height sprite in a cell |"""
+        return col * self.tile + (self.tile - width) // 2, row * self.tile + (self.tile - height) // 2
+
+    def blocked(self, x, y, width, height):
+        """
+        Return True if a rectangle overlaps a wall or lies outside the maze.
+        Only the few cells under the rectangle are looked up, so the cost does not depend on the maze size.
+        Fractional coordinates are widened to the whole pixels the rectangle touches.
+        """
+        tile, band, maze = self.tile, self.wall_width, self.maze
+        right, bottom = math.ceil(x + width), math.ceil(y + height)  # Exclusive
+        x, y = math.floor(x), math.floor(y)
+        if x < 0 or y < 0 or right > maze.cols * tile or bottom > maze.rows * tile:
+            return True
+
+        walls, cols = maze.walls, maze.cols
+        for row in range(y // tile, (bottom - 1) // tile + 1):
+            top_edge = row * tile
+            # The rectangle's extent inside this row of cells
+            inner_top, inner_bottom = max(y, top_edge) - top_edge, min(bottom, top_edge + tile) - top_edge
+            for col in range(x // tile, (right - 1) // tile + 1):
+                left_edge = col * tile
+                inner_left, inner_right = max(x, left_edge) - left_edge, min(right, left_edge + tile) - left_edge
+                cell = walls[col + row * cols]
+                if ((cell & TOP and inner_top < band) or (cell & BOTTOM and inner_bottom > tile - band)
+                        or (cell & LEFT and inner_left < band) or (cell & RIGHT and inner_right > tile - band)):
+                    return True
+        return False
+
+    def clip_move(self, rect, dx, dy):
+        """
+        Return how far (dx, dy) a rectangle can move before it touches a wall.
+        The axes are resolved separately, so a sprite blocked on one axis still slides along the other.
+        Each step shortens the move by at most a pixel and lands exactly on 0 at the end, so fractional
+        speeds stop after at most ceil(abs(d)) steps too.
+        """
+        x, y, width, height = rect
+        while dx and self.blocked(x + dx, y, width, height):
+            dx -= min(dx, 1) if dx > 0 else max(dx, -1)
+        while dy and self.blocked(x + dx, y + dy, width, height):
+            dy -= min(dy, 1) if dy > 0 else max(dy, -1)
+        return dx, dy
@@ -0,0 +1,114 @@
+"""
+Pre-generate mazes in parallel into an on-disk cache.
+
+Each maze is identified by (cols, rows, seed, algorithm); generation is deterministic, so the
+hash of those parameters addresses the maze's content. Mazes already in the cache are skipped:
+
+    python maze_batch.py 200 500 500                 # 200 mazes of 500x500, seeds 0-199
+    python maze_batch.py 64 1000 1000 --seed-start 1000 --algorithm eller --workers 4
+"""
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from labyrinth import GENERATORS, generate_maze
+from maze_file import FORMAT_VERSION, load_maze, save_maze
+
+CACHE_DIR = os.path.join('cache', 'mazes')
+CACHE_VERSION = 1  # Bump when a generator changes, so old mazes are not reused
+
+
+def cache_key(cols, rows, seed, algorithm='backtracker'):
+    """
+    Return the hex digest addressing a maze in the cache.
+    The seed must be an int: the key is built from its text, so 1 and "1" would otherwise share a key
+    although random.Random seeds them differently.
+    """
+    if not isinstance(seed, int) or isinstance(seed, bool):
+        raise TypeError(f"Cached mazes need an int seed, not {type(seed).__name__} {seed!r}")
+    description = f"{CACHE_VERSION}:{FORMAT_VERSION}:{algorithm}:{cols}x{rows}:{seed}"
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+def cache_path(job, cache_dir=CACHE_DIR):
+    """| Return where the maze of a (cols, rows, seed, algorithm) job is stored |"""
+    key = cache_key(*job)
+    return os.path.join(cache_dir, key[:2], key + '.maze')  # Two-level layout keeps directories small
+
+
+def load_cached(job, cache_dir=CACHE_DIR):
+    """| Open a cached maze (memory-mapped), or return None if it has not been generated |"""
+    path = cache_path(job, cache_dir)
+    return load_maze(path) if os.path.exists(path) else None
+
+
+def _build(job, cache_dir):
+    """| Generate one maze into the cache and return its path (runs in a worker process) |"""
+    cols, rows, seed, algorithm = job
+    path = cache_path(job, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # save_maze replaces the file atomically, so readers never see a half-written maze
+    save_maze(generate_maze(cols, rows, seed=seed, algorithm=algorithm), path)
+    return path
+
+
+def build_batch(jobs, cache_dir=CACHE_DIR, workers=None):
+    """
+    Make sure every job's maze is in the cache.
+    :param jobs: (cols, rows, seed, algorithm) tuples; the seed must be an int.
+    :param workers: Worker processes (default: one per CPU); 1 builds in this process.
+    :return: (paths in job order, number of mazes generated).
+    """
+    jobs = [tuple(job) for job in jobs]
+    for job in jobs:
+        if job[2] is None:
+            raise ValueError("Batch jobs need a seed, or they could never be found in the cache again")
+        if job[3] not in GENERATORS:
+            raise ValueError(f"Unknown maze algorithm {job[3]!r}")
+
+    paths = [cache_path(job, cache_dir) for job in jobs]
+    pending = list(dict.fromkeys(job for job, path in zip(jobs, paths) if not os.path.exists(path)))
+    build = partial(_build, cache_dir=cache_dir)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pending) <= 1:
+        for job in pending:
+            build(job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Each worker gets several jobs per round trip; results are only short paths
+            chunksize = max(1, len(pending) // (workers * 4))
+            for _ in executor.map(build, pending, chunksize=chunksize):
+                pass
+    return paths, len(pending)
+
+
+def main(argv=None):
+    """| Parse arguments and build a batch of mazes with consecutive seeds |"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pre-generate mazes into the on-disk cache.")
+    parser.add_argument('count', type=int, help="number of mazes")
+    parser.add_argument('cols', type=int)
+    parser.add_argument('rows', type=int)
+    parser.add_argument('--seed-start', type=int, default=0, help="seed of the first maze (default: 0)")
+    parser.add_argument('--algorithm', choices=sorted(GENERATORS), default='backtracker')
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--cache', default=CACHE_DIR, help=f"cache directory (default: {CACHE_DIR})")
+    args = parser.parse_args(argv)
+
+    jobs = [(args.cols, args.rows, seed, args.algorithm)
+            for seed in range(args.seed_start, args.seed_start + args.count)]
+    start = time.perf_counter()
+    _, generated = build_batch(jobs, args.cache, args.workers)
+    elapsed = time.perf_counter() - start
+
+    rate = generated / elapsed if generated else 0
+    print(f"{generated} generated, {len(jobs) - generated} already cached, "
+          f"{elapsed:.2f} s ({rate:.1f} mazes/s) in {args.cache}")
+
+
+if __name__ == "__main__":
+    main()
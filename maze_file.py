@@ -0,0 +1,154 @@
+"""
+Binary maze files.
+
+Layout (little-endian):
+
+    magic      4s   b'MAZE'
+    version    H    FORMAT_VERSION
+    flags      H    HAS_SEED if the seed field is meaningful
+    cols       I
+    rows       I
+    seed       Q
+    algorithm  16s  ASCII name, padded with NUL bytes
+    walls           ceil(cols * rows / 2) bytes: two 4-bit wall masks per byte, even cells in the low nibble
+"""
+import mmap
+import struct
+from functools import partial
+
+from atomic_file import write_atomically
+from labyrinth import GENERATORS, Maze, generate_maze
+
+MAGIC = b'MAZE'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHIIQ16s')
+HAS_SEED = 1
+
+_HIGH_NIBBLE = bytes((value << 4) & 0xFF for value in range(256))  # Moves a mask to the high nibble
+_LOW_MASK = bytes(value & 0x0F for value in range(256))
+_HIGH_MASK = bytes(value >> 4 for value in range(256))
+
+
+class NibbleView:
+    """| Read-only sequence of 4-bit wall masks backed by a buffer (e.g. an mmap), without copying it |"""
+
+    def __init__(self, buffer, offset, length):
+        """
+        Initialize the view.
+        :param buffer: Object supporting the buffer protocol holding the packed masks.
+        :param offset: Position of the first packed byte in the buffer.
+        :param length: Number of masks (cells).
+        """
+        self._buffer = buffer
+        self._data = memoryview(buffer)[offset:offset + (length + 1) // 2]
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("cell index out of range")
+        return (self._data[index >> 1] >> ((index & 1) << 2)) & 0x0F
+
+    def packed(self):
+        """| Return the packed bytes as a memoryview (no copy) |"""
+        return self._data
+
+    def to_bytearray(self):
+        """| Unpack into a mutable bytearray, one mask per byte, as generated mazes store them |"""
+        data = bytes(self._data)
+        walls = bytearray(self._length)
+        walls[0::2] = data.translate(_LOW_MASK)[:(self._length + 1) // 2]
+        walls[1::2] = data.translate(_HIGH_MASK)[:self._length // 2]
+        return walls
+
+    def close(self):
+        """| Release the view and close the underlying mmap, if any |"""
+        self._data.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def pack_walls(walls):
+    """| Pack one-per-byte wall masks into two masks per byte |"""
+    if isinstance(walls, NibbleView):
+        return bytes(walls.packed())
+    size = (len(walls) + 1) // 2
+    low = bytes(walls[0::2])
+    high = bytes(walls[1::2]).translate(_HIGH_NIBBLE)
+    packed = int.from_bytes(low, 'little') | int.from_bytes(high, 'little')
+    return packed.to_bytes(size, 'little')
+
+
+def save_maze(maze, path):
+    """
+    Write a maze to a binary maze file.
+    The file is replaced atomically, so a maze loaded from the same path (whose walls are memory-mapped
+    from the old file) can be saved back over it.
+    """
+    algorithm = (maze.algorithm or '').encode('ascii')
+    if len(algorithm) > 16:
+        raise ValueError(f"Algorithm name {maze.algorithm!r} is longer than 16 characters")
+    has_seed = isinstance(maze.seed, int) and 0 <= maze.seed < 2 ** 64
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, HAS_SEED if has_seed else 0,
+                         maze.cols, maze.rows, maze.seed if has_seed else 0, algorithm)
+    data = header + pack_walls(maze.walls)  # Read the walls before anything is written
+    write_atomically(path, partial(_write_bytes, data))
+
+
+def _write_bytes(data, path):
+    """| Write bytes to a new file |"""
+    with open(path, 'wb') as maze_file:
+        maze_file.write(data)
+
+
+def load_maze(path):
+    """
+    Open a binary maze file as a Maze whose walls are a NibbleView over a memory map.
+    Nothing is read up front: only the pages of the cells that are accessed are loaded.
+    Call maze.walls.close() to release the file early; use walls.to_bytearray() for a mutable copy.
+    """
+    with open(path, 'rb') as maze_file:
+        buffer = mmap.mmap(maze_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a maze file")
+        magic, version, flags, cols, rows, seed, algorithm = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a maze file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has maze format version {version}; only {FORMAT_VERSION} is supported")
+        if len(buffer) < HEADER.size + (cols * rows + 1) // 2:
+            raise ValueError(f"{path} is truncated")
+    except ValueError:
+        buffer.close()
+        raise
+
+    walls = NibbleView(buffer, HEADER.size, cols * rows)
+    return Maze(cols, rows, walls, seed=seed if flags & HAS_SEED else None,
+                algorithm=algorithm.rstrip(b'\0').decode('ascii'))
+
+
+def main(argv=None):
+    """| Generate a maze and save it, so a large maze can be made once and then opened instantly |"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a maze and write it to a binary maze file.")
+    parser.add_argument('path', help="file to write")
+    parser.add_argument('cols', type=int)
+    parser.add_argument('rows', type=int)
+    parser.add_argument('--seed', type=int, help="seed for a reproducible maze (default: random)")
+    parser.add_argument('--algorithm', choices=sorted(GENERATORS), default='backtracker')
+    args = parser.parse_args(argv)
+
+    maze = generate_maze(args.cols, args.rows, seed=args.seed, algorithm=args.algorithm)
+    save_maze(maze, args.path)
+    print(f"{args.cols}x{args.rows} {maze.algorithm} maze (seed {maze.seed}) written to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
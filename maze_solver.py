@@ -0,0 +1,220 @@
+from array import array
+from heapq import heappop, heappush
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; distance fields fall back to a BFS per update
+    np = None
+
+from labyrinth import TOP, RIGHT, BOTTOM, LEFT
+
+
+def _open_neighbors(walls, cols, index):
+    """| Return the indices of the cells reachable from a cell in one step |"""
+    cell = walls[index]
+    neighbors = []
+    if not cell & TOP:
+        neighbors.append(index - cols)
+    if not cell & RIGHT:
+        neighbors.append(index + 1)
+    if not cell & BOTTOM:
+        neighbors.append(index + cols)
+    if not cell & LEFT:
+        neighbors.append(index - 1)
+    return neighbors
+
+
+def _path_from_parents(maze, parents, goal):
+    """| Follow parent links back from the goal and return the path as (x, y) cells, start first |"""
+    path = []
+    index = goal
+    while index != -1:
+        path.append((index % maze.cols, index // maze.cols))
+        index = parents[index]
+    path.reverse()
+    return path
+
+
+def bfs_path(maze, start, goal):
+    """
+    Return the shortest path between two cells as a list of (x, y), both ends included.
+    :return: None if the goal cannot be reached.
+    """
+    cols, walls = maze.cols, maze.walls
+    start, goal = maze.index(*start), maze.index(*goal)
+    parents = array('i', [-2]) * (cols * maze.rows)  # -2 not reached, -1 the start
+    parents[start] = -1
+    queue = [start]
+    for index in queue:  # The list grows while it is iterated: a queue without pops
+        if index == goal:
+            return _path_from_parents(maze, parents, goal)
+        for neighbor in _open_neighbors(walls, cols, index):
+            if parents[neighbor] == -2:
+                parents[neighbor] = index
+                queue.append(neighbor)
+    return None
+
+
+def astar_path(maze, start, goal):
+    """
+    Return the shortest path between two cells as a list of (x, y), using A* with a Manhattan heuristic.
+    Explores fewer cells than BFS when the maze has open areas or loops; None if the goal cannot be reached.
+    """
+    cols, walls = maze.cols, maze.walls
+    goal_x, goal_y = goal
+    start, goal = maze.index(*start), maze.index(*goal)
+    size = cols * maze.rows
+    parents = array('i', [-2]) * size
+    costs = array('i', [-1]) * size  # Best known steps from the start
+    parents[start], costs[start] = -1, 0
+
+    heap = [(0, 0, start)]  # (estimated total, steps so far, cell)
+    while heap:
+        _, steps, index = heappop(heap)
+        if index == goal:
+            return _path_from_parents(maze, parents, goal)
+        if steps > costs[index]:
+            continue  # A shorter route to this cell was found after it was queued
+        for neighbor in _open_neighbors(walls, cols, index):
+            if costs[neighbor] == -1 or steps + 1 < costs[neighbor]:
+                costs[neighbor] = steps + 1
+                parents[neighbor] = index
+                estimate = steps + 1 + abs(neighbor % cols - goal_x) + abs(neighbor // cols - goal_y)
+                heappush(heap, (estimate, steps + 1, neighbor))
+    return None
+
+
+def bfs_distances(maze, source):
+    """| Return the number of steps from a cell (x, y) to every cell, -1 where it cannot be reached |"""
+    cols, walls = maze.cols, maze.walls
+    distances = array('i', [-1]) * (cols * maze.rows)
+    source = maze.index(*source)
+    distances[source] = 0
+    queue = [source]
+    for index in queue:
+        next_distance = distances[index] + 1
+        for neighbor in _open_neighbors(walls, cols, index):
+            if distances[neighbor] == -1:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+    return distances
+
+
+class DistanceField:
+    """
+    | Steps from every cell of a maze to a target (the player), shared by every chaser |
+    In a perfect maze (a tree) the field is kept with NumPy in depth-first (Euler tour) order:
+    a subtree is one slice, so moving the target to a neighbour is two slice updates and a jump
+    anywhere is a vectorised recompute. Other mazes, or no NumPy, fall back to a BFS per update.
+    """
+
+    def __init__(self, maze, target=None):
+        """| Initialize the field; target is an (x, y) cell, or None to set it later with update() |"""
+        self.maze = maze
+        self.target = None  # Index of the target cell
+        self.is_tree = np is not None and self._build_tree()
+        self._distances = None  # array('i') by cell index when not using the tree
+        if target is not None:
+            self.update(target)
+
+    def _build_tree(self):
+        """
+        Number the cells in depth-first order from the top-left cell.
+        :return: False (and nothing is kept) if the maze has loops or unreachable cells.
+        """
+        maze = self.maze
+        cols, walls, size = maze.cols, maze.walls, maze.cols * maze.rows
+        parent = array('i', [-2]) * size
+        order = array('i')  # Cells in depth-first (pre-)order
+        parent[0] = -1
+        stack = [0]
+        while stack:
+            index = stack.pop()
+            order.append(index)
+            for neighbor in _open_neighbors(walls, cols, index):
+                if neighbor == parent[index]:
+                    continue
+                if parent[neighbor] != -2:
+                    return False  # Reached twice: the maze has a loop
+                parent[neighbor] = index
+                stack.append(neighbor)
+        if len(order) != size:
+            return False
+
+        order = np.frombuffer(order, dtype=np.int32)
+        parent = np.frombuffer(parent, dtype=np.int32)
+        position = np.empty(size, dtype=np.int64)  # Cell -> place in the order
+        position[order] = np.arange(size)
+
+        # Depths top-down and subtree sizes bottom-up, following the order
+        parent_position = np.full(size, -1, dtype=np.int64)
+        parent_position[1:] = position[parent[order[1:]]]
+        depth = array('i', bytes(4 * size))
+        subtree = array('i', [1]) * size
+        parent_position_list = parent_position.tolist()
+        for p in range(1, size):
+            depth[p] = depth[parent_position_list[p]] + 1
+        for p in range(size - 1, 0, -1):
+            subtree[parent_position_list[p]] += subtree[p]
+
+        self._position_list = position.tolist()
+        self._parent = parent
+        self._depth = np.frombuffer(depth, dtype=np.int32).astype(np.int64)
+        self._end = np.arange(size) + np.frombuffer(subtree, dtype=np.int32)  # One past the subtree, by position
+        self._field = None  # Distances by position
+        return True
+
+    def update(self, target):
+        """| Move the target to a cell (x, y) and bring the distances up to date |"""
+        index = self.maze.index(*target)
+        if index == self.target:
+            return
+        if not self.is_tree:
+            self._distances = bfs_distances(self.maze, target)
+        elif self.target is not None and self._parent[index] == self.target:
+            # Moved down into a child's subtree: closer to it by one, further from everything else
+            self._field += 1
+            self._field[self._position_list[index]:self._end[self._position_list[index]]] -= 2
+        elif self.target is not None and self._parent[self.target] == index:
+            # Moved up to the parent: further from the old subtree, closer to everything else
+            self._field -= 1
+            self._field[self._position_list[self.target]:self._end[self._position_list[self.target]]] += 2
+        else:
+            self._recompute(index)
+        self.target = index
+
+    def _recompute(self, index):
+        """
+        Compute every distance to a new target with array operations.
+        distance(u) = depth(u) + depth(target) - 2 * depth(lowest common ancestor). The target's ancestors
+        are nested position ranges, so the number containing each cell is a running count of range starts
+        minus range ends.
+        """
+        size = len(self._end)
+        target = self._position_list[index]
+        ancestors = np.flatnonzero(self._end[:target + 1] > target)  # Ranges starting at or before the target
+        containing = np.cumsum(np.bincount(ancestors, minlength=size)
+                               - np.bincount(self._end[ancestors], minlength=size + 1)[:size])
+        self._field = self._depth + (self._depth[target] + 2) - 2 * containing
+
+    def distance(self, x, y):
+        """| Return the steps from cell (x, y) to the target, -1 if it cannot be reached |"""
+        index = x + y * self.maze.cols
+        if self.is_tree:
+            return int(self._field[self._position_list[index]])
+        return self._distances[index]
+
+    def next_step(self, x, y):
+        """
+        Return the neighbouring cell (x, y) one step closer to the target.
+        :return: None at the target or where the target cannot be reached.
+        """
+        distance = self.distance(x, y)
+        if distance <= 0:
+            return None
+        cols = self.maze.cols
+        for neighbor in _open_neighbors(self.maze.walls, cols, x + y * cols):
+            neighbor_x, neighbor_y = neighbor % cols, neighbor // cols
+            if self.distance(neighbor_x, neighbor_y) == distance - 1:
+                return neighbor_x, neighbor_y
+        return None
@@ -0,0 +1,89 @@
+import pygame
+
+from labyrinth import TOP, RIGHT, BOTTOM, LEFT
+
+BACKGROUND_COLOR = pygame.Color('darkslategray')  # Cells not reached yet
+VISITED_COLOR = pygame.Color('black')
+WALL_COLOR = pygame.Color('darkorange')
+CURRENT_COLOR = pygame.Color('saddlebrown')
+
+
+class MazeRenderer:
+    """| A maze drawn once to a background surface; only the cells that change are repainted |"""
+
+    def __init__(self, maze, tile, is_visited=None, floor_color=VISITED_COLOR):
+        """
+        Initialize the renderer and paint the whole maze once.
+        :param tile: Size of a cell in pixels.
+        :param is_visited: Function telling whether a cell (index in maze.walls) is visited;
+                           every cell counts as visited if None (a finished maze).
+        :param floor_color: Color of visited cells.
+        """
+        self.maze = maze
+        self.tile = tile
+        self.is_visited = is_visited or (lambda index: True)
+        self.floor_color = floor_color
+        self.wall_width = max(1, tile // 50)  # Each cell draws its half of a shared wall
+
+        self.surface = pygame.Surface((maze.cols * tile, maze.rows * tile))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        for index in range(maze.cols * maze.rows):
+            self.paint_cell(index)
+
+        self._current = None  # Cell highlighted on the screen last frame
+
+    def cell_rect(self, index):
+        """| Return the area a cell covers |"""
+        y, x = divmod(index, self.maze.cols)
+        return pygame.Rect(x * self.tile, y * self.tile, self.tile, self.tile)
+
+    def paint_cell(self, index):
+        """
+        Paint one cell onto the background surface and return its area.
+        Walls are drawn inside the cell's own area, so a cell can be repainted without touching its neighbours.
+        """
+        rect = self.cell_rect(index)
+        surface, width, tile = self.surface, self.wall_width, self.tile
+        surface.fill(self.floor_color if self.is_visited(index) else BACKGROUND_COLOR, rect)
+
+        walls = self.maze.walls[index]
+        if walls & TOP:
+            surface.fill(WALL_COLOR, (rect.x, rect.y, tile, width))
+        if walls & RIGHT:
+            surface.fill(WALL_COLOR, (rect.right - width, rect.y, width, tile))
+        if walls & BOTTOM:
+            surface.fill(WALL_COLOR, (rect.x, rect.bottom - width, tile, width))
+        if walls & LEFT:
+            surface.fill(WALL_COLOR, (rect.x, rect.y, width, tile))
+        return rect
+
+    def draw_full(self, screen, current=None):
+        """| Blit the whole background (first frame, or after something else drew over the screen) |"""
+        screen.blit(self.surface, (0, 0))
+        self._current = None
+        self._highlight(screen, current)
+        return [screen.get_rect()]
+
+    def update(self, screen, changed, current=None):
+        """
+        Repaint the changed cells, move the highlight to the current cell and return the dirty areas.
+        The cost depends on the number of changed cells, not on the size of the maze.
+        """
+        dirty = [self.paint_cell(index) for index in changed]
+        if self._current is not None and self._current != current:
+            dirty.append(self.cell_rect(self._current))  # Restore the cell under the old highlight
+        for rect in dirty:
+            screen.blit(self.surface, rect, rect)
+        dirty.extend(self._highlight(screen, current))
+        return dirty
+
+    def _highlight(self, screen, current):
+        """| Draw the highlight over the current cell and return the area it covers |"""
+        self._current = current
+        if current is None:
+            return []
+        rect = self.cell_rect(current)
+        inset = self.wall_width
+        screen.fill(CURRENT_COLOR, rect.inflate(-2 * inset, -2 * inset))
+        return [rect]
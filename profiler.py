@@ -0,0 +1,159 @@
+import json
+import time
+from array import array
+
+import pygame
+
+from text_cache import text_cache
+
+PHASES = ('events', 'simulate', 'triggers', 'render', 'display')
+
+
+class FrameProfiler:
+    """| Per-phase frame timings kept in a fixed-size ring buffer |"""
+
+    def __init__(self, capacity=600, enabled=False):
+        """
+        Initialize an empty profiler.
+        :param capacity: Number of most recent frames kept.
+        :param enabled: Whether timings are recorded; when False every call returns immediately.
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self._phase_index = {phase: i for i, phase in enumerate(PHASES)}
+
+        # Ring buffer: frame start times, total frame times and per-phase times (all seconds)
+        self._starts = array('d', bytes(8 * capacity))
+        self._totals = array('d', bytes(8 * capacity))
+        self._phases = array('d', bytes(8 * capacity * len(PHASES)))
+        self._next = 0  # Slot the next frame is written to
+        self.frames = 0  # Frames recorded so far (may exceed capacity)
+
+        self._frame_start = 0.0
+        self._last = 0.0
+
+    def begin_frame(self):
+        """| Start timing a frame |"""
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        base = self._next * len(PHASES)
+        for i in range(len(PHASES)):
+            self._phases[base + i] = 0.0
+
+    def mark(self, phase):
+        """| Charge the time since the previous mark to a phase (a phase may be marked several times) |"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._phases[self._next * len(PHASES) + self._phase_index[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """| Finish the frame and advance the ring buffer |"""
+        if not self.enabled:
+            return
+        slot = self._next
+        self._starts[slot] = self._frame_start
+        self._totals[slot] = time.perf_counter() - self._frame_start
+        self._next = (slot + 1) % self.capacity
+        self.frames += 1
+
+    def _recent_slots(self, count=None):
+        """| Return ring-buffer slots of recorded frames, oldest first |"""
+        stored = min(self.frames, self.capacity)
+        if count is not None:
+            stored = min(stored, count)
+        return [(self._next - stored + i) % self.capacity for i in range(stored)]
+
+    def recent_totals(self, count=None):
+        """| Return the most recent total frame times in seconds, oldest first |"""
+        return [self._totals[slot] for slot in self._recent_slots(count)]
+
+    def averages(self, count=60):
+        """| Return {phase: mean seconds} over the most recent frames, plus 'frame' for the total |"""
+        slots = self._recent_slots(count)
+        if not slots:
+            return {}
+        result = {phase: sum(self._phases[slot * len(PHASES) + i] for slot in slots) / len(slots)
+                  for i, phase in enumerate(PHASES)}
+        result['frame'] = sum(self._totals[slot] for slot in slots) / len(slots)
+        return result
+
+    def chrome_trace(self):
+        """| Return the recorded frames as a Chrome trace (chrome://tracing, Perfetto) dictionary |"""
+        events = []
+        for slot in self._recent_slots():
+            start_us = self._starts[slot] * 1e6
+            events.append({'name': 'frame', 'ph': 'X', 'ts': start_us, 'dur': self._totals[slot] * 1e6,
+                           'pid': 1, 'tid': 1})
+            # Phases are laid out back to back; a phase marked several times shows as one span
+            offset_us = start_us
+            for i, phase in enumerate(PHASES):
+                duration_us = self._phases[slot * len(PHASES) + i] * 1e6
+                if duration_us:
+                    events.append({'name': phase, 'ph': 'X', 'ts': offset_us, 'dur': duration_us,
+                                   'pid': 1, 'tid': 1})
+                    offset_us += duration_us
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump_chrome_trace(self, path):
+        """| Write the Chrome trace to a file; returns False if nothing was recorded |"""
+        if not self.frames:
+            return False
+        with open(path, 'w') as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+        return True
+
+
+class ProfilerOverlay:
+    """| A small panel with ms/frame, per-phase averages and a frame-time histogram |"""
+
+    WIDTH, HEIGHT = 240, 170
+    MARGIN = 6  # Inner padding of the panel
+    HISTOGRAM_FRAMES = 114  # Frames in the histogram: 2-pixel bars fill the width inside the margins
+    BUDGET = 1 / 30  # Frame time (seconds) that fills the histogram's height
+
+    def __init__(self, profiler, refresh_ms=250):
+        """| Initialize the overlay; the text is refreshed at most every refresh_ms milliseconds |"""
+        self.profiler = profiler
+        self.refresh_ms = refresh_ms
+        self.rect = pygame.Rect(10, 10, self.WIDTH, self.HEIGHT)
+        self._panel = None
+        self._refreshed_at = -refresh_ms
+
+    def _build_panel(self):
+        """| Render the panel surface from the latest averages |"""
+        panel = pygame.Surface(self.rect.size)
+        panel.fill((20, 20, 20))
+        averages = self.profiler.averages()
+        frame_ms = averages.get('frame', 0) * 1000
+        fps = 1000 / frame_ms if frame_ms else 0
+
+        lines = [f"{frame_ms:6.2f} ms/frame  {fps:6.0f} fps"]
+        lines += [f"{phase:>9}: {averages.get(phase, 0) * 1000:6.2f} ms" for phase in PHASES]
+        y = 4
+        for line in lines:
+            # Numbers change every refresh, so don't fill the shared text cache with them
+            panel.blit(text_cache.font(None, 20).render(line, True, (230, 230, 230)), (self.MARGIN, y))
+            y += 16
+
+        # Histogram of recent frame times, newest on the right, kept inside the margins
+        base_y = self.HEIGHT - 4
+        max_bar = base_y - y - 4
+        inner_width = self.WIDTH - 2 * self.MARGIN
+        bar_width = max(1, inner_width // self.HISTOGRAM_FRAMES)
+        for i, total in enumerate(self.profiler.recent_totals(min(self.HISTOGRAM_FRAMES, inner_width // bar_width))):
+            bar = min(max_bar, int(total / self.BUDGET * max_bar))
+            color = (80, 200, 80) if total <= 1 / 60 else (220, 80, 60)
+            pygame.draw.rect(panel, color, (self.MARGIN + bar_width * i, base_y - bar, bar_width, bar + 1))
+        return panel
+
+    def draw(self, screen):
+        """| Draw the panel and return the area it covers |"""
+        now = time.monotonic() * 1000  # pygame.time.get_ticks() stays at 0 without pygame.init()
+        if self._panel is None or now - self._refreshed_at >= self.refresh_ms:
+            self._panel = self._build_panel()
+            self._refreshed_at = now
+        screen.blit(self._panel, self.rect)
+        return self.rect
@@ -0,0 +1,74 @@
+import pygame
+
+
+class DirtyRenderer:
+    """| Redraw and push only the screen areas that changed since the last frame |"""
+
+    def __init__(self, screen, bg_color, profiler=None):
+        """| Initialize the renderer; the first frame is always drawn in full |"""
+        self.screen = screen
+        self.bg_color = bg_color
+        self.background = None  # Optional pre-rendered surface (e.g. a level) shown instead of bg_color
+        self.profiler = profiler  # Optional FrameProfiler; drawing is charged to 'render'
+        self.full_redraw = True
+
+    def invalidate(self):
+        """| Force a full redraw next frame (after something else drew over the screen) |"""
+        self.full_redraw = True
+
+    def set_background(self, background):
+        """| Show a pre-rendered surface behind the sprites (None for the plain background color) |"""
+        self.background = background
+        self.invalidate()
+
+    def clear(self, rect=None):
+        """| Restore the background over an area, or over the whole screen if rect is None |"""
+        if self.background is None:
+            self.screen.fill(self.bg_color, rect)
+        elif rect is None:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.blit(self.background, rect, rect)
+
+    def render(self, sprites):
+        """
+        Draw the sprites and update the display, returning the rectangles that were pushed.
+        Each sprite needs a `draw_rect` (where it is to be drawn), a `drawn_rect` (where it was
+        last drawn, or None) and a `blitme()` that draws it and returns the old and new areas it touched.
+        """
+        if self.full_redraw:
+            self.full_redraw = False
+            self.clear()
+            for sprite in sprites:
+                sprite.blitme()
+            self._mark_render()
+            pygame.display.flip()
+            return [self.screen.get_rect()]
+
+        moved = [sprite for sprite in sprites if sprite.drawn_rect != sprite.draw_rect]
+        if not moved:
+            self._mark_render()
+            return []  # Nothing changed; the frame costs nothing
+
+        # Clear where the moved sprites used to be
+        touched = []
+        for sprite in moved:
+            if sprite.drawn_rect is not None:
+                self.clear(sprite.drawn_rect)
+                touched.append(sprite.drawn_rect)
+            touched.append(sprite.draw_rect)
+
+        # Redraw, in order, every sprite that overlaps a touched area
+        moved_ids = {id(sprite) for sprite in moved}
+        dirty = []
+        for sprite in sprites:
+            if id(sprite) in moved_ids or sprite.draw_rect.collidelist(touched) != -1:
+                dirty.extend(sprite.blitme())
+
+        self._mark_render()
+        pygame.display.update(dirty)
+        return dirty
+
+    def _mark_render(self):
+        if self.profiler:
+            self.profiler.mark('render')
@@ -0,0 +1,107 @@
+import pygame
+
+
+class Scene:
+    """| Base class for a mini-game that runs inside the adventure window |"""
+
+    caption = None  # Window caption while the scene is active
+    size = None  # (width, height) of the scene's drawing area; None means the whole screen
+    event_driven = False  # True if the scene only changes in response to input
+    idle_timeout = None  # For event-driven scenes: longest sleep (ms) between frames; None sleeps until input
+
+    def __init__(self):
+        """| Initialize the scene state shared by all scenes |"""
+        self.finished = False  # Set to True when the scene wants to be popped
+        self.mouse_pos = (0, 0)  # Cursor position translated into scene coordinates
+
+    def handle_event(self, event):
+        """| Respond to a single input event (positions are already in scene coordinates) |"""
+
+    def update(self):
+        """| Advance the scene's logic by one frame |"""
+
+    def draw(self, surface):
+        """| Draw the scene onto the given surface |"""
+
+    def finish(self):
+        """| Ask the scene stack to remove this scene |"""
+        self.finished = True
+
+
+class SceneStack:
+    """| Runs scenes on top of the adventure, sharing its screen and clock |"""
+
+    def __init__(self, screen):
+        """| Initialize an empty stack drawing to the given display surface |"""
+        self.screen = screen
+        self._scenes = []  # List of (scene, viewport, on_finish, previous caption)
+
+    def __bool__(self):
+        return bool(self._scenes)
+
+    @property
+    def top(self):
+        """| The active scene, or None when the stack is empty |"""
+        return self._scenes[-1][0] if self._scenes else None
+
+    def push(self, scene, on_finish=None):
+        """| Make a scene active; on_finish is called once it has been popped |"""
+        viewport = self._viewport_for(scene)
+        previous_caption = pygame.display.get_caption()[0]
+        if scene.caption:
+            pygame.display.set_caption(scene.caption)
+        self._scenes.append((scene, viewport, on_finish, previous_caption))
+
+        # Clear the area around a scene that is smaller than the window
+        self.screen.fill((0, 0, 0))
+
+    def pop(self):
+        """| Remove the active scene, restore the caption and run its callback |"""
+        scene, _, on_finish, previous_caption = self._scenes.pop()
+        pygame.display.set_caption(previous_caption)
+        if on_finish:
+            on_finish(scene)
+        return scene
+
+    def _viewport_for(self, scene):
+        """| Return the screen area a scene draws in, centered for smaller scenes |"""
+        screen_rect = self.screen.get_rect()
+        if scene.size is None:
+            return screen_rect
+        viewport = pygame.Rect((0, 0), scene.size)
+        viewport.center = screen_rect.center
+        return viewport.clip(screen_rect)
+
+    def _translate(self, event, viewport):
+        """| Return the event with any mouse position moved into scene coordinates |"""
+        if hasattr(event, 'pos'):
+            attributes = dict(event.dict)
+            attributes['pos'] = (event.pos[0] - viewport.x, event.pos[1] - viewport.y)
+            return pygame.event.Event(event.type, attributes)
+        return event
+
+    def _track_mouse(self, scene, viewport):
+        """| Store the cursor position in the scene's coordinates |"""
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        scene.mouse_pos = (mouse_x - viewport.x, mouse_y - viewport.y)
+
+    def handle_event(self, event):
+        """| Forward an event to the active scene |"""
+        scene, viewport, _, _ = self._scenes[-1]
+        self._track_mouse(scene, viewport)
+        scene.handle_event(self._translate(event, viewport))
+
+    def update(self):
+        """| Update the active scene and pop it once it has finished |"""
+        scene, viewport, _, _ = self._scenes[-1]
+        self._track_mouse(scene, viewport)
+        scene.update()
+        if scene.finished:
+            self.pop()
+            return False
+        return True
+
+    def draw(self):
+        """| Draw the active scene into its viewport |"""
+        scene, viewport, _, _ = self._scenes[-1]
+        scene.draw(self.screen.subsurface(viewport))
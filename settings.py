@@ -10,6 +10,26 @@ class Settings:
         self.bg_color = (234, 230, 230)
 
         # Human settings
-        self.human_speed_factor = 4
+        self.human_speed_factor = 4  # Pixels per simulation tick (480 px/s at 120 ticks/s)
 
-        self.fps = 60 # FPS
\ No newline at end of file
+        # Enemy settings
+        self.trigger_radius = 70  # Distance (pixels, centre to centre) that starts an encounter
+
+        # Level settings
+        self.maze_level = False  # Play inside a generated maze instead of the open room
+        self.maze_tile = 100  # Size of a maze cell (pixels); the maze fills the screen
+        self.maze_seed = None  # Seed for a reproducible maze, or None for a new one every game
+
+        # Blackjack settings
+        self.blackjack_decks = 1  # Decks in the Blackjack shoe (1 to 8)
+        self.blackjack_penetration = 0.75  # Fraction of the shoe dealt before it is reshuffled
+
+        self.fps = 60 # FPS; the rendering cap, 0 renders as fast as the display allows
+
+        # Simulation settings
+        self.tick_rate = 120  # Simulation ticks per second, independent of the frame rate
+        self.max_frame_time = 0.25  # Longest frame (seconds) caught up on; beyond that the game slows down
+
+        # Profiler settings
+        self.profiler_enabled = False  # Record frame timings from the start (F3 shows the overlay either way)
+        self.profile_trace_path = 'frame_trace.json'  # Chrome trace written on exit if anything was recorded
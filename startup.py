@@ -0,0 +1,41 @@
+import json
+import time
+
+
+class StartupTimer:
+    """| Timeline of the steps between launch and the first frame, for the startup report |"""
+
+    def __init__(self):
+        """| Start the timeline now (import this module before anything heavy) |"""
+        self.started = time.perf_counter()
+        self.marks = []  # (step, seconds since started)
+
+    def mark(self, step):
+        """| Record that a step has just finished |"""
+        self.marks.append((step, time.perf_counter() - self.started))
+
+    def steps(self):
+        """| Return (step, milliseconds the step took, milliseconds since launch) for every mark |"""
+        steps = []
+        previous = 0.0
+        for step, elapsed in self.marks:
+            steps.append((step, (elapsed - previous) * 1000, elapsed * 1000))
+            previous = elapsed
+        return steps
+
+    def report(self):
+        """| Return the timeline as a table |"""
+        lines = [f"{'step':<16}{'ms':>9}{'total ms':>11}"]
+        lines += [f"{step:<16}{ms:9.1f}{total:11.1f}" for step, ms, total in self.steps()]
+        lines.append("(Python's own startup comes before this; `python -X importtime` breaks imports down)")
+        return '\n'.join(lines)
+
+    def to_json(self):
+        """| Return the timeline as one line of JSON |"""
+        return json.dumps({'steps': [{'step': step, 'ms': ms, 'total_ms': total}
+                                     for step, ms, total in self.steps()],
+                           'first_frame_ms': self.marks[-1][1] * 1000 if self.marks else None})
+
+
+# Created when the entry point first imports this module: the start of the timeline
+startup_timer = StartupTimer()
@@ -0,0 +1,119 @@
+import json
+import os
+from collections import OrderedDict
+
+import pygame
+
+FONT_PATHS_FILE = os.path.join('cache', 'font_paths.json')
+
+
+class TextCache:
+    """| Bounded LRU caches for font objects and rendered text surfaces |"""
+
+    def __init__(self, max_fonts=16, max_surfaces=256, font_paths_file=FONT_PATHS_FILE):
+        """
+        Initialize empty caches with the given capacities.
+        :param font_paths_file: JSON file remembering which file each system font name resolved to,
+                                or None to look system fonts up in every run.
+        """
+        self.max_fonts = max_fonts
+        self.max_surfaces = max_surfaces
+        self.font_paths_file = font_paths_file
+        self._font_paths = None  # System font name -> font file (None for pygame's default), loaded lazily
+        self._fonts = OrderedDict()  # (name, size, sysfont) -> Font
+        self._surfaces = OrderedDict()  # (name, size, sysfont, text, color, antialias) -> Surface
+
+        # Counters to confirm steady-state frames do no text rasterisation
+        self.hits = 0
+        self.misses = 0
+        self.font_hits = 0
+        self.font_misses = 0
+
+    def font(self, name, size, sysfont=False):
+        """| Return a cached font; name=None is pygame's default font, sysfont picks a system font |"""
+        key = (name, size, sysfont)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.font_hits += 1
+            return font
+
+        self.font_misses += 1
+        font = pygame.font.Font(self._system_font_path(name) if sysfont else name, size)
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def render(self, text, size, color, name=None, sysfont=False, antialias=True):
+        """| Return a cached surface with the text rendered in the given font and colour |"""
+        # Normalise to RGBA so 'red', (255, 0, 0) and (255, 0, 0, 255) share an entry; tuples skip pygame.Color
+        if type(color) is not tuple:
+            color = tuple(pygame.Color(color))
+        elif len(color) == 3:
+            color += (255,)
+        key = (name, size, sysfont, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(name, size, sysfont).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def _system_font_path(self, name):
+        """
+        Return the font file for a system font name, as SysFont would pick it.
+        Finding it means listing every installed font (fc-list on Linux), so the answer is kept on disk
+        and later runs skip the scan.
+        """
+        if self._font_paths is None:
+            self._font_paths = {}
+            if self.font_paths_file:
+                try:
+                    with open(self.font_paths_file) as paths_file:
+                        self._font_paths = json.load(paths_file)
+                except (OSError, ValueError):
+                    pass  # Not written yet, or unreadable: it is rebuilt as fonts are looked up
+
+        path = self._font_paths.get(name, '')
+        if path == '' or (path is not None and not os.path.exists(path)):  # Unknown, or uninstalled since
+            path = pygame.font.match_font(name)  # None if missing: SysFont uses the default font too
+            self._font_paths[name] = path
+            if self.font_paths_file:
+                try:
+                    os.makedirs(os.path.dirname(self.font_paths_file) or '.', exist_ok=True)
+                    with open(self.font_paths_file, 'w') as paths_file:
+                        json.dump(self._font_paths, paths_file)
+                except OSError:
+                    pass  # Only a cache; the lookup simply happens again next run
+        return path
+
+    def stats(self):
+        """| Return the hit/miss counters as a dictionary |"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'font_hits': self.font_hits,
+            'font_misses': self.font_misses,
+            'cached_surfaces': len(self._surfaces),
+            'cached_fonts': len(self._fonts),
+        }
+
+    def reset_stats(self):
+        """| Zero the hit/miss counters, keeping the cached entries |"""
+        self.hits = self.misses = self.font_hits = self.font_misses = 0
+
+    def clear(self):
+        """| Drop every cached font and surface |"""
+        self._fonts.clear()
+        self._surfaces.clear()
+
+
+# Shared by the adventure, Blackjack and Dialog
+text_cache = TextCache()
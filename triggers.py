@@ -0,0 +1,94 @@
+class SpatialHash:
+    """| Uniform grid that buckets objects by the cell their position falls in |"""
+
+    def __init__(self, cell_size):
+        """| Initialize an empty grid with square cells of the given size (pixels) |"""
+        self.cell_size = cell_size
+        self._cells = {}  # (column, row) -> set of objects
+        self._where = {}  # object -> (column, row)
+
+    def __len__(self):
+        return len(self._where)
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, obj, x, y):
+        """| Add an object at a position (or move it there if it is already stored) |"""
+        cell = self._cell(x, y)
+        old_cell = self._where.get(obj)
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            self._discard(obj, old_cell)
+        self._cells.setdefault(cell, set()).add(obj)
+        self._where[obj] = cell
+
+    def remove(self, obj):
+        """| Remove an object from the grid |"""
+        cell = self._where.pop(obj, None)
+        if cell is not None:
+            self._discard(obj, cell)
+
+    def _discard(self, obj, cell):
+        bucket = self._cells[cell]
+        bucket.discard(obj)
+        if not bucket:
+            del self._cells[cell]
+
+    def query(self, x, y, radius):
+        """| Yield the objects in every cell that a circle around (x, y) overlaps |"""
+        min_col, min_row = self._cell(x - radius, y - radius)
+        max_col, max_row = self._cell(x + radius, y + radius)
+        cells = self._cells
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    yield from bucket
+
+
+class TriggerZones:
+    """| Circular trigger zones around any number of entities, reporting enter and exit events |"""
+
+    def __init__(self, radius):
+        """| Initialize zones of the given radius (pixels) around each entity's centre |"""
+        self.radius = radius
+        self._radius_sq = radius * radius
+        # With cells as large as the radius, a query only ever touches a 3x3 block of cells
+        self._grid = SpatialHash(cell_size=radius)
+        self._inside = set()  # Entities whose zone the mover is currently in
+
+    def __len__(self):
+        return len(self._grid)
+
+    def add(self, entity):
+        """| Add (or re-position, after it moved) the zone around an entity |"""
+        center_x, center_y = entity.rect.center
+        self._grid.insert(entity, center_x, center_y)
+
+    def remove(self, entity):
+        """| Remove the zone around an entity |"""
+        self._grid.remove(entity)
+        self._inside.discard(entity)
+
+    def nearby(self, mover):
+        """| Return the set of entities whose zone contains the mover's centre |"""
+        x, y = mover.rect.center
+        radius_sq = self._radius_sq
+        inside = set()
+        for entity in self._grid.query(x, y, self.radius):
+            entity_x, entity_y = entity.rect.center
+            dx = x - entity_x
+            dy = y - entity_y
+            if dx * dx + dy * dy <= radius_sq:  # Squared distance, no sqrt
+                inside.add(entity)
+        return inside
+
+    def update(self, mover):
+        """| Return (entered, exited): the zones the mover has entered and left since the last update |"""
+        inside = self.nearby(mover)
+        entered = inside - self._inside
+        exited = self._inside - inside
+        self._inside = inside
+        return entered, exited